@@ -12,20 +12,28 @@ Purpose:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Iterable, Optional, Sequence
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 from core.storage.interface import WalletStorage, WalletBatch, KeyNS
 
 
 DD_NS = KeyNS("DD")
 
+# Key prefixes are fixed; build them once instead of per call.
+_POS_PREFIX = DD_NS.k("POSITION:")
+_BAL_PREFIX = DD_NS.k("BALANCE:")
+_OUT_PREFIX = DD_NS.k("OUTPUT:")
+
 
 # -------------------------
 # Persisted DD structures
 # -------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DDPosition:
     """
     Represents a single DigiDollar collateral position.
@@ -44,7 +52,7 @@ class DDPosition:
     is_active: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class DDBalance:
     """
     Storage view of DD balance for an address or account scope.
@@ -55,7 +63,7 @@ class DDBalance:
     balance_minor: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DDOutput:
     """
     Storage view of a DD-related output (UTXO-style record).
@@ -69,6 +77,115 @@ class DDOutput:
     is_spent: bool = False
 
 
+# Field order per record, computed once. All records are flat (scalars only),
+# so a shallow dict is equivalent to asdict() without its recursive copy.
+_POSITION_FIELDS = tuple(f.name for f in fields(DDPosition))
+_BALANCE_FIELDS = tuple(f.name for f in fields(DDBalance))
+_OUTPUT_FIELDS = tuple(f.name for f in fields(DDOutput))
+
+
+def _to_raw(obj: Any, names: Sequence[str]) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in names}
+
+
+_POSITION_VALUES = itemgetter(*_POSITION_FIELDS)
+_BALANCE_VALUES = itemgetter(*_BALANCE_FIELDS)
+_OUTPUT_VALUES = itemgetter(*_OUTPUT_FIELDS)
+
+
+def _decode_rows(cls: Any, values: itemgetter, n_fields: int, rows: Iterable[Any]) -> Iterable[Any]:
+    """
+    Decode scanned (key, raw) rows into records.
+
+    Rows come from our own save_* path, so fields are pulled positionally
+    in one C-level itemgetter call instead of a **raw keyword splat. Any
+    other shape (a defaulted field missing, or unknown keys) takes the
+    keyword path, exactly like load_*: missing defaults are filled in and
+    unknown keys raise TypeError.
+    """
+    for _, raw in rows:
+        if len(raw) == n_fields:
+            try:
+                args = values(raw)
+            except KeyError:
+                pass
+            else:
+                yield cls(*args)
+                continue
+        yield cls(**raw)
+
+
+# -------------------------
+# Read cache
+# -------------------------
+
+# Off by default: the cache only sees writes made through its own DDStore.
+DEFAULT_CACHE_SIZE = 0
+
+
+class _LRUCache:
+    """
+    Bounded LRU of raw (stored) dicts keyed by storage key.
+
+    Holds the same dicts that were written to storage, never the dataclass
+    instances handed to callers, so mutating a loaded record cannot leak
+    into later reads. All operations hold a lock, so one store can be
+    shared across threads.
+
+    Every write-through (put/pop) bumps a generation counter. A reader that
+    missed takes the generation before reading storage and fills the entry
+    with fill(), which is dropped if any write happened in between, so a
+    value read before a concurrent save can never overwrite it.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._maxsize <= 0:
+            return None
+        with self._lock:
+            raw = self._data.get(key)
+            if raw is not None:
+                self._data.move_to_end(key)
+            return raw
+
+    def put(self, key: str, raw: Dict[str, Any]) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._generation += 1
+            self._insert(key, raw)
+
+    def fill(self, key: str, raw: Dict[str, Any], generation: int) -> None:
+        """Cache a value read from storage, unless a write landed since `generation`."""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            if self._generation == generation and key not in self._data:
+                self._insert(key, raw)
+
+    def pop(self, key: str) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def _insert(self, key: str, raw: Dict[str, Any]) -> None:
+        # caller holds the lock
+        self._data[key] = raw
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
 # -------------------------
 # DD Store
 # -------------------------
@@ -76,79 +193,100 @@ class DDOutput:
 class DDStore:
     """
     Storage-backed DigiDollar state store.
+
+    Point reads (load_position / get_balance / load_output) hit storage
+    directly unless cache_size > 0, which enables a bounded write-through
+    LRU per record kind. The cache is only coherent when every write to
+    the DD keys goes through this one DDStore instance: writes made through
+    another DDStore, directly on the storage, or by another process sharing
+    the same database are not seen. Leave it off unless that holds.
     """
 
-    def __init__(self, storage: WalletStorage) -> None:
+    def __init__(self, storage: WalletStorage, *, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         self._storage = storage
+        self._pos_cache = _LRUCache(cache_size)
+        self._bal_cache = _LRUCache(cache_size)
+        self._out_cache = _LRUCache(cache_size)
+
+    def _cached_get(self, cache: _LRUCache, key: str) -> Optional[Dict[str, Any]]:
+        raw = cache.get(key)
+        if raw is None:
+            generation = cache.generation()
+            raw = self._storage.get(key)
+            if raw is not None:
+                cache.fill(key, raw, generation)
+        return raw
 
     # ---- positions ----
 
     def _pos_key(self, position_id: str) -> str:
-        return DD_NS.k(f"POSITION:{position_id}")
+        return _POS_PREFIX + position_id
 
     def save_position(self, pos: DDPosition) -> None:
-        self._storage.put(self._pos_key(pos.position_id), asdict(pos))
+        key = self._pos_key(pos.position_id)
+        raw = _to_raw(pos, _POSITION_FIELDS)
+        self._storage.put(key, raw)
+        self._pos_cache.put(key, raw)
 
     def load_position(self, position_id: str) -> Optional[DDPosition]:
-        raw = self._storage.get(self._pos_key(position_id))
+        raw = self._cached_get(self._pos_cache, self._pos_key(position_id))
         if raw is None:
             return None
         return DDPosition(**raw)
 
     def delete_position(self, position_id: str) -> None:
-        self._storage.delete(self._pos_key(position_id))
+        key = self._pos_key(position_id)
+        self._storage.delete(key)
+        self._pos_cache.pop(key)
 
     def iter_positions(self) -> Iterable[DDPosition]:
-        prefix = DD_NS.k("POSITION:")
-        for k in self._storage.keys(prefix=prefix):
-            raw = self._storage.get(k)
-            if raw is not None:
-                yield DDPosition(**raw)
+        return _decode_rows(DDPosition, _POSITION_VALUES, len(_POSITION_FIELDS), self._storage.scan(_POS_PREFIX))
 
     # ---- balances ----
 
     def _bal_key(self, wallet_id: str, account_id: str, address: str) -> str:
-        return DD_NS.k(f"BALANCE:{wallet_id}:{account_id}:{address}")
+        return _BAL_PREFIX + wallet_id + ":" + account_id + ":" + address
 
     def set_balance(self, bal: DDBalance) -> None:
-        self._storage.put(self._bal_key(bal.wallet_id, bal.account_id, bal.address), asdict(bal))
+        key = self._bal_key(bal.wallet_id, bal.account_id, bal.address)
+        raw = _to_raw(bal, _BALANCE_FIELDS)
+        self._storage.put(key, raw)
+        self._bal_cache.put(key, raw)
 
     def get_balance(self, wallet_id: str, account_id: str, address: str) -> Optional[DDBalance]:
-        raw = self._storage.get(self._bal_key(wallet_id, account_id, address))
+        raw = self._cached_get(self._bal_cache, self._bal_key(wallet_id, account_id, address))
         if raw is None:
             return None
         return DDBalance(**raw)
 
     def iter_balances(self, wallet_id: str, account_id: str) -> Iterable[DDBalance]:
-        prefix = DD_NS.k(f"BALANCE:{wallet_id}:{account_id}:")
-        for k in self._storage.keys(prefix=prefix):
-            raw = self._storage.get(k)
-            if raw is not None:
-                yield DDBalance(**raw)
+        prefix = _BAL_PREFIX + wallet_id + ":" + account_id + ":"
+        return _decode_rows(DDBalance, _BALANCE_VALUES, len(_BALANCE_FIELDS), self._storage.scan(prefix))
 
     # ---- outputs ----
 
     def _out_key(self, txid: str, vout: int) -> str:
-        return DD_NS.k(f"OUTPUT:{txid}:{vout}")
+        return _OUT_PREFIX + txid + ":" + str(vout)
 
     def save_output(self, out: DDOutput) -> None:
-        self._storage.put(self._out_key(out.txid, out.vout), asdict(out))
+        key = self._out_key(out.txid, out.vout)
+        raw = _to_raw(out, _OUTPUT_FIELDS)
+        self._storage.put(key, raw)
+        self._out_cache.put(key, raw)
 
     def load_output(self, txid: str, vout: int) -> Optional[DDOutput]:
-        raw = self._storage.get(self._out_key(txid, vout))
+        raw = self._cached_get(self._out_cache, self._out_key(txid, vout))
         if raw is None:
             return None
         return DDOutput(**raw)
 
     def delete_output(self, txid: str, vout: int) -> None:
-        self._storage.delete(self._out_key(txid, vout))
+        key = self._out_key(txid, vout)
+        self._storage.delete(key)
+        self._out_cache.pop(key)
 
     def iter_outputs(self) -> Iterable[DDOutput]:
-        prefix = DD_NS.k("OUTPUT:")
-        for k in self._storage.keys(prefix=prefix):
-            raw = self._storage.get(k)
-            if raw is not None:
-                yield DDOutput(**raw)
+        return _decode_rows(DDOutput, _OUTPUT_VALUES, len(_OUTPUT_FIELDS), self._storage.scan(_OUT_PREFIX))
 
     # -------------------------
     # Atomic batch helper
@@ -167,13 +305,26 @@ class DDStore:
         This is a STORAGE helper only.
         No minting/redeem rules. No validation. No business logic.
         """
-        with self._storage.begin_batch() as b:
-            # outputs
-            for out in outputs_upsert:
-                b.put(self._out_key(out.txid, out.vout), asdict(out))
-            for txid, vout in outputs_delete:
-                b.delete(self._out_key(txid, vout))
-
-            # balances
-            for bal in balances_upsert:
-                b.put(self._bal_key(bal.wallet_id, bal.account_id, bal.address), asdict(bal))
+        out_keys = [self._out_key(out.txid, out.vout) for out in outputs_upsert]
+        out_del_keys = [self._out_key(txid, vout) for txid, vout in outputs_delete]
+        bal_keys = [self._bal_key(bal.wallet_id, bal.account_id, bal.address) for bal in balances_upsert]
+
+        try:
+            with self._storage.begin_batch() as b:
+                # outputs
+                for k, out in zip(out_keys, outputs_upsert):
+                    b.put(k, _to_raw(out, _OUTPUT_FIELDS))
+                for k in out_del_keys:
+                    b.delete(k)
+
+                # balances
+                for k, bal in zip(bal_keys, balances_upsert):
+                    b.put(k, _to_raw(bal, _BALANCE_FIELDS))
+        finally:
+            # Committed or rolled back, touched keys reload from storage next time.
+            for k in out_keys:
+                self._out_cache.pop(k)
+            for k in out_del_keys:
+                self._out_cache.pop(k)
+            for k in bal_keys:
+                self._bal_cache.pop(k)
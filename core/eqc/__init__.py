@@ -12,6 +12,8 @@ License: MIT (see root LICENSE)
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 # Context / data types
 from .context import EQCContext
 
@@ -21,17 +23,12 @@ from .verdicts import VerdictType, ReasonCode
 # Engine (always exists)
 from .engine import EQCEngine
 
-# EQCDecision location varies across refactors — resolve safely.
-try:
-    # If you ever add decision.py later
+# EQCDecision lives in engine.py; prefer a dedicated decision.py if one is
+# added later. find_spec probes without executing a failing import.
+if find_spec(f"{__name__}.decision") is not None:
     from .decision import EQCDecision  # type: ignore
-except ModuleNotFoundError:
-    try:
-        # Common pattern: decision dataclass defined in engine.py
-        from .engine import EQCDecision  # type: ignore
-    except Exception:
-        # Fallback: some builds keep it in context.py
-        from .context import EQCDecision  # type: ignore
+else:
+    from .engine import EQCDecision
 
 
 __all__ = [
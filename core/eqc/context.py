@@ -18,14 +18,94 @@ License: MIT (see root LICENSE)
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Mapping, Optional, Tuple
 from hashlib import sha256
+from operator import attrgetter
+from types import MappingProxyType
 import json
+import math
+import struct
 import time
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-@dataclass(frozen=True)
+
+def _now_ts() -> int:
+    return int(time.time())
+
+
+def _key_text(key: Any) -> str:
+    """
+    Text of a mapping key, as json.dumps writes it: str keys as they are,
+    int/float/bool/None keys converted. Other key types raise TypeError.
+    """
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if math.isfinite(key):
+            return float.__repr__(key)
+        return "NaN" if key != key else ("Infinity" if key > 0 else "-Infinity")
+    raise TypeError(f"EQCContext keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _item_key_text(item: Tuple[Any, Any]) -> str:
+    return _key_text(item[0])
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Deep read-only copy of a JSON-like value.
+
+    Mappings become MappingProxyType, sorted by key text (see _key_text),
+    and lists/tuples become tuples, at every level. Other values are
+    returned as they are (scalars are already immutable; unsupported types
+    are rejected when hashed).
+    """
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        items = sorted(value.items(), key=_item_key_text)
+        return MappingProxyType({k: freeze_value(v) for k, v in items})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(v) for v in value)
+    return value
+
+
+def _has_non_finite(value: Any) -> bool:
+    # Walks to_dict() output: plain dicts, lists and scalars.
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def thaw_value(value: Any) -> Any:
+    """
+    Plain dict/list copy of a value built by freeze_value(), for JSON output.
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class DeviceContext:
     # Optional so tests + callers can omit it
     device_id: Optional[str] = None
@@ -39,7 +119,7 @@ class DeviceContext:
     app_version: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkContext:
     # Keep your original idea (network name)
     network: str = "mainnet"        # mainnet, testnet
@@ -54,14 +134,14 @@ class NetworkContext:
     peer_count: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserContext:
     user_id: Optional[str] = None
     biometric_available: bool = False
     pin_set: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionContext:
     action: str                     # send, mint, redeem, sign, vote
     asset: str                      # DGB, DigiAsset, DigiDollar
@@ -69,36 +149,189 @@ class ActionContext:
     recipient: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EQCContext:
     """
     Canonical context passed into EQC.
 
     This object is hashed and may be bound to WSQK scopes later.
+
+    `extra` accepts any mapping; it is deep-copied once into read-only
+    containers (see freeze_value) so later changes to the caller's dict,
+    or to any dict/list nested in it, cannot alter the context (or its
+    cached hash).
+
+    `norm_device_type`, `norm_action` and `norm_asset` are the lowercased
+    device type / action / asset, derived at construction for the engine's
+    invariant checks. They are not part of equality or the hash.
     """
     action: ActionContext
     device: DeviceContext
     network: NetworkContext
     user: UserContext
-    timestamp: int = field(default_factory=lambda: int(time.time()))
-    extra: Dict[str, Any] = field(default_factory=dict)
+    timestamp: int = field(default_factory=_now_ts)
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
+    # Memoized canonical_bytes() / context_hash() (the context is immutable once built).
+    _cached_canonical: Optional[bytes] = field(default=None, init=False, compare=False, repr=False)
+    _cached_hash: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+
+    # Derived from the (frozen) sub-contexts in __post_init__.
+    norm_device_type: str = field(default="", init=False, compare=False, repr=False)
+    norm_action: str = field(default="", init=False, compare=False, repr=False)
+    norm_asset: str = field(default="", init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        setattr_ = object.__setattr__
+        setattr_(self, "extra", freeze_value(self.extra))
+        setattr_(self, "norm_device_type", (getattr(self.device, "device_type", None) or "").lower())
+        setattr_(self, "norm_action", (getattr(self.action, "action", None) or "").lower())
+        setattr_(self, "norm_asset", (getattr(self.action, "asset", None) or "").lower())
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "action": self.action.__dict__,
-            "device": self.device.__dict__,
-            "network": self.network.__dict__,
-            "user": self.user.__dict__,
+            "action": asdict(self.action),
+            "device": asdict(self.device),
+            "network": asdict(self.network),
+            "user": asdict(self.user),
             "timestamp": self.timestamp,
-            "extra": dict(self.extra),
+            "extra": thaw_value(self.extra),
         }
 
+    def to_json(self) -> str:
+        """
+        Compact, key-sorted JSON of to_dict() for audit logs.
+
+        Uses orjson when installed and falls back to the stdlib for values
+        orjson rejects. Both parse back to to_dict(), but the text may differ
+        (e.g. float formatting), so compare parsed values, not strings.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            try:
+                text = orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+            except TypeError:
+                # non-str dict keys, ints beyond 64 bits, ...: stdlib handles these
+                pass
+            else:
+                # NaN/Infinity come out of orjson as null; the stdlib keeps them.
+                if "null" not in text or not _has_non_finite(data):
+                    return text
+        return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
     def context_hash(self) -> str:
         """
         Stable hash of the context used for:
         - audit logs
         - WSQK binding
         - replay protection
+
+        Computed once per instance and cached.
         """
-        encoded = json.dumps(self.to_dict(), sort_keys=True).encode()
-        return sha256(encoded).hexdigest()
+        h = self._cached_hash
+        if h is None:
+            h = sha256(self.canonical_bytes()).hexdigest()
+            object.__setattr__(self, "_cached_hash", h)
+        return h
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Deterministic binary encoding that context_hash() digests.
+
+        Computed once per instance and cached.
+        """
+        b = self._cached_canonical
+        if b is None:
+            b = _canonical(self)
+            object.__setattr__(self, "_cached_canonical", b)
+        return b
+
+
+# -------------------------
+# Canonical binary encoding
+# -------------------------
+
+# Bump if the encoding below ever changes (hashes are not comparable across versions).
+_CANONICAL_VERSION = b"EQC-CTX-1"
+
+# Field order per section, in dataclass declaration order, computed once.
+_ACTION_FIELDS = tuple(f.name for f in fields(ActionContext))
+_DEVICE_FIELDS = tuple(f.name for f in fields(DeviceContext))
+_NETWORK_FIELDS = tuple(f.name for f in fields(NetworkContext))
+_USER_FIELDS = tuple(f.name for f in fields(UserContext))
+
+_SECTION_VALUES = (
+    attrgetter(*_ACTION_FIELDS),
+    attrgetter(*_DEVICE_FIELDS),
+    attrgetter(*_NETWORK_FIELDS),
+    attrgetter(*_USER_FIELDS),
+)
+
+_pack_len = struct.Struct(">I").pack
+_pack_f64 = struct.Struct(">d").pack
+
+
+def _encode_value(out: bytearray, v: Any) -> None:
+    """
+    Append a type-tagged, length-prefixed encoding of `v` to `out`.
+
+    Supports the JSON-compatible value space (None, bool, int, float, str,
+    list/tuple, and mappings whose keys json.dumps accepts; non-str keys are
+    encoded as the text json.dumps would write). Anything else raises
+    TypeError, as json.dumps did before.
+    """
+    # Strings are the most common value, so they are checked first. bool is
+    # an int subclass and must be matched before the int branch.
+    if isinstance(v, str):
+        raw = v.encode("utf-8")
+        out += b"S"
+        out += _pack_len(len(raw))
+        out += raw
+    elif v is None:
+        out += b"N"
+    elif v is True:
+        out += b"T"
+    elif v is False:
+        out += b"F"
+    elif isinstance(v, int):
+        raw = v.to_bytes((v.bit_length() + 8) // 8, "big", signed=True)
+        out += b"I"
+        out += _pack_len(len(raw))
+        out += raw
+    elif isinstance(v, float):
+        out += b"D"
+        out += _pack_f64(v)
+    elif isinstance(v, (list, tuple)):
+        out += b"L"
+        out += _pack_len(len(v))
+        for item in v:
+            _encode_value(out, item)
+    elif type(v) is MappingProxyType:
+        # built by freeze_value(), already in key order
+        _encode_sorted_mapping(out, v)
+    elif isinstance(v, dict):
+        _encode_sorted_mapping(out, dict(sorted(v.items(), key=_item_key_text)))
+    else:
+        raise TypeError(f"EQCContext value of type {type(v).__name__} is not hashable")
+
+
+def _encode_sorted_mapping(out: bytearray, m: Mapping[Any, Any]) -> None:
+    # For a mapping already in key-text order (see freeze_value).
+    out += b"M"
+    out += _pack_len(len(m))
+    for k, v in m.items():
+        _encode_value(out, _key_text(k))
+        _encode_value(out, v)
+
+
+def _canonical(ctx: EQCContext) -> bytes:
+    """
+    Deterministic binary encoding of an EQCContext (no dict building, no JSON).
+    """
+    out = bytearray(_CANONICAL_VERSION)
+    for values, section in zip(_SECTION_VALUES, (ctx.action, ctx.device, ctx.network, ctx.user)):
+        for v in values(section):
+            _encode_value(out, v)
+    _encode_value(out, ctx.timestamp)
+    _encode_sorted_mapping(out, ctx.extra)
+    return bytes(out)
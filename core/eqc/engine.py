@@ -15,83 +15,104 @@ License: MIT (see root LICENSE)
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 import importlib
 import inspect
 import os
-from typing import Any, Dict, List, Optional, Sequence, Type
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 
 from core.eqc.context import EQCContext
-from core.eqc.verdicts import Verdict, VerdictType
+from core.eqc.verdicts import Reason, ReasonCode, Verdict, VerdictType
 from core.eqc.policies.registry import PolicyPackRegistry
 
 
 # --- Dynamic class resolution -------------------------------------------------
 
 
-def _resolve_class(module_path: str, preferred_names: List[str], required_method: str) -> Type:
+@lru_cache(maxsize=None)
+def _resolve_class(module_path: str, preferred_names: Tuple[str, ...], required_method: str) -> Type:
     """
     Resolve a class from a module without hardcoding its exact name.
     Selects a class that:
     - is defined in the target module
     - has `required_method`
+
+    Memoized: each (module, names, method) spec is resolved once per process.
     """
-    mod = importlib.import_module(module_path)
+    # Already-imported modules skip the import machinery entirely.
+    mod = sys.modules.get(module_path) or importlib.import_module(module_path)
+    mod_name = mod.__name__
+    ns = vars(mod)
+    exported = ns.get("__all__")
+    allowed = None if exported is None else frozenset(exported)
+
+    def _qualifies(obj: Any) -> bool:
+        # isinstance, not `type(obj) is type`: ABC subclasses have ABCMeta.
+        # MRO __dict__ scan instead of hasattr (no getattr + exception path).
+        return (
+            isinstance(obj, type)
+            and obj.__module__ == mod_name
+            and any(required_method in klass.__dict__ for klass in obj.__mro__)
+        )
+
+    # Preferred names first: a hit needs no module scan.
+    for pname in preferred_names:
+        if allowed is not None and pname not in allowed:
+            continue
+        obj = ns.get(pname)
+        if _qualifies(obj):
+            return obj
 
-    candidates = []
-    for name, obj in vars(mod).items():
-        if inspect.isclass(obj) and obj.__module__ == mod.__name__ and hasattr(obj, required_method):
-            candidates.append((name, obj))
+    names = exported if exported is not None else list(ns)
+    candidates = [(name, ns.get(name)) for name in names if _qualifies(ns.get(name))]
 
     if not candidates:
         raise ImportError(f"No class with '{required_method}()' found in {module_path}.")
 
-    by_name = {name: obj for name, obj in candidates}
-    for pname in preferred_names:
-        if pname in by_name:
-            return by_name[pname]
+    # deterministic fallback by name (smallest wins; no full sort needed)
+    return min(candidates, key=itemgetter(0))[1]
+
 
-    # deterministic fallback by name
-    return sorted(candidates, key=lambda x: x[0])[0][1]
+@lru_cache(maxsize=8)
+def _split_policy_packs(raw: str) -> Tuple[str, ...]:
+    parts = (p.strip() for p in raw.split(","))
+    return tuple(p for p in parts if p)
 
 
-def _parse_policy_packs_env() -> List[str]:
+def _parse_policy_packs_env() -> Tuple[str, ...]:
     """
     Reads policy packs from env var:
 
       EQC_POLICY_PACKS="module:PackA,module:PackB"
 
-    Returns list of refs (strings).
+    Returns a tuple of refs (strings). The env var is read on every call (so
+    changes are honoured); splitting is cached per distinct value.
     """
-    raw = os.getenv("EQC_POLICY_PACKS", "") or ""
-    parts = [p.strip() for p in raw.split(",")]
-    return [p for p in parts if p]
+    return _split_policy_packs(os.environ.get("EQC_POLICY_PACKS") or "")
 
 
 # --- Reason + Verdict helpers (compatible with your Verdict model) -----------
 
 
+# Default code for engine-generated reasons, resolved once at import.
+_ENGINE_REASON_CODE: Any = getattr(ReasonCode, "ENGINE_INVARIANT", None) or getattr(
+    ReasonCode, "POLICY_RULE_MATCH", None
+)
+
+
 def _safe_reason(message: str, details: Optional[dict] = None, code_override: Any = None):
     """
-    Create a Reason object if the repo defines it.
-    If code_override is provided and ReasonCode exists, we use it.
+    Create a Reason for an engine-generated verdict.
+    If code_override is provided, it is used as the reason code.
     """
     details = details or {}
-
-    try:
-        from core.eqc.verdicts import Reason, ReasonCode  # type: ignore
-
-        if code_override is not None:
-            return Reason(code=code_override, message=message, details=details)
-
-        code = getattr(ReasonCode, "ENGINE_INVARIANT", None) or getattr(
-            ReasonCode, "POLICY_RULE_MATCH", None
-        )
-        if code is not None:
-            return Reason(code=code, message=message, details=details)
-
-        return Reason(code="ENGINE_INVARIANT", message=message, details=details)  # type: ignore
-    except Exception:
-        return {"message": message, "details": details, "code": str(code_override) if code_override else None}
+    if code_override is not None:
+        return Reason(code=code_override, message=message, details=details)
+    return Reason(code=_ENGINE_REASON_CODE or "ENGINE_INVARIANT", message=message, details=details)  # type: ignore[arg-type]
 
 
 def _make_verdict(
@@ -100,33 +121,81 @@ def _make_verdict(
     details: Optional[dict] = None,
     *,
     reason_code: Any = None,
+    step_up: Any = None,
 ) -> Verdict:
     """
     Construct Verdict using the repo's real constructor shape:
       Verdict(type=..., reasons=[...], step_up=...)
     """
-    return Verdict(type=vtype, reasons=[_safe_reason(message, details, code_override=reason_code)])  # type: ignore[arg-type]
-
-
-class _CompatStepUp:
-    """Minimal StepUp object for tests: must expose .requirements (list)."""
-
-    def __init__(self, requirements: List[Any]):
-        self.requirements = requirements
+    return Verdict(
+        type=vtype,
+        reasons=[_safe_reason(message, details, code_override=reason_code)],  # type: ignore[list-item]
+        step_up=step_up,
+    )
 
 
-def _attach_step_up(verdict: Verdict, requirements: List[Any]) -> Verdict:
+def _shared_verdict(
+    vtype: VerdictType,
+    message: str,
+    details: Dict[str, Any],
+    *,
+    reason_code: Any,
+    step_up: Any = None,
+) -> Verdict:
     """
-    IMPORTANT: Verdict is a frozen dataclass in this repo.
-    Tests expect: decision.verdict.step_up.requirements
-    So we must set the dataclass field using object.__setattr__.
+    Like _make_verdict, but deeply immutable: reasons is a tuple and the
+    reason details a read-only mapping. For verdicts built once at import
+    and returned to every caller.
     """
-    step = _CompatStepUp(requirements=requirements)
-    try:
-        object.__setattr__(verdict, "step_up", step)
-    except Exception:
-        setattr(verdict, "step_up", step)
-    return verdict
+    reason = _safe_reason(message, MappingProxyType(dict(details)), code_override=reason_code)
+    return Verdict(type=vtype, reasons=(reason,), step_up=step_up)  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True, slots=True)
+class _CompatStepUp:
+    """Minimal StepUp object for tests: must expose .requirements (a tuple here)."""
+
+    requirements: Tuple[Any, ...]
+
+
+# --- Invariant verdicts (constant, built once) --------------------------------
+#
+# Every input that trips an OS invariant maps to one fixed verdict, so these
+# are shared singletons, built with _shared_verdict so no caller can alter
+# what the next one receives.
+
+_HOSTILE_RUNTIME_VERDICTS: Dict[str, Verdict] = {
+    "browser": _shared_verdict(
+        VerdictType.DENY,
+        "Execution denied: browser context is not permitted.",
+        {"device_type": "browser"},
+        reason_code=ReasonCode.BROWSER_CONTEXT_BLOCKED,
+    ),
+    "extension": _shared_verdict(
+        VerdictType.DENY,
+        "Execution denied: extension context is not permitted.",
+        {"device_type": "extension"},
+        reason_code=ReasonCode.EXTENSION_CONTEXT_BLOCKED,
+    ),
+}
+
+_DD_ACTIONS = frozenset({"mint", "redeem"})
+_DD_ASSETS = frozenset({"digidollar", "dd"})
+
+# One step-up payload shared by every DD invariant verdict.
+_DD_STEP_UP = _CompatStepUp(requirements=("confirm_user_intent",))
+
+_DD_STEP_UP_VERDICTS: Dict[Tuple[str, str], Verdict] = {
+    (action, asset): _shared_verdict(
+        VerdictType.STEP_UP,
+        "Step-up required: DigiDollar mint/redeem requires additional confirmation.",
+        {"action": action, "asset": asset},
+        reason_code=ReasonCode.MINT_REDEEM_REQUIRES_STEP_UP,
+        step_up=_DD_STEP_UP,
+    )
+    for action in sorted(_DD_ACTIONS)
+    for asset in sorted(_DD_ASSETS)
+}
 
 
 # --- Policy evaluate adapter --------------------------------------------------
@@ -156,33 +225,104 @@ def _call_policy_evaluate(policy_obj, *, context, device_signals, tx_signals):
     return fn(context)
 
 
-# --- Resolved implementation classes -----------------------------------------
+def _policy_evaluate_adapter(policy_obj) -> Callable[[Any, Any, Any], Any]:
+    """
+    Choose, once per policy object, how to call its evaluate(...).
+
+    Returns adapter(context, device_signals, tx_signals) using the same
+    preference order as _call_policy_evaluate (kwargs, then positional,
+    then context only). Each form is checked with Signature.bind() instead
+    of being invoked, so a TypeError raised inside the policy propagates
+    rather than being mistaken for a signature mismatch.
+    """
+    fn = getattr(policy_obj, "evaluate", None)
+    if fn is None:
+        raise TypeError("EQC policy object has no evaluate() method")
+
+    try:
+        sig = inspect.signature(fn)
+    except (TypeError, ValueError):
+        # Not introspectable (e.g. some C callables): probe per call.
+        return lambda c, d, t: _call_policy_evaluate(
+            policy_obj, context=c, device_signals=d, tx_signals=t
+        )
+
+    def _binds(*args: Any, **kwargs: Any) -> bool:
+        try:
+            sig.bind(*args, **kwargs)
+        except TypeError:
+            return False
+        return True
+
+    if _binds(None, device_signals=None, tx_signals=None):
+        return lambda c, d, t: fn(c, device_signals=d, tx_signals=t)
+
+    if _binds(None, None, None):
+        return lambda c, d, t: fn(c, d, t)
+
+    # Context only (if even this does not bind, the call raises TypeError as before).
+    return lambda c, d, t: fn(c)
+
 
+# --- Default implementation classes (resolved lazily) ------------------------
+#
+# Resolution imports the target module, so it only happens when an engine is
+# built without an explicit policy/classifier.
 
-_PolicyClass = _resolve_class(
-    module_path="core.eqc.policy",
-    preferred_names=["DefaultPolicy", "EQCPolicy", "Policy", "BasePolicy"],
-    required_method="evaluate",
+_POLICY_SPEC = (
+    "core.eqc.policy",
+    ("DefaultPolicy", "EQCPolicy", "Policy", "BasePolicy"),
+    "evaluate",
 )
 
-_DeviceClassifierClass = _resolve_class(
-    module_path="core.eqc.classifiers.device_classifier",
-    preferred_names=["DeviceClassifier", "DefaultDeviceClassifier"],
-    required_method="classify",
+_DEVICE_CLASSIFIER_SPEC = (
+    "core.eqc.classifiers.device_classifier",
+    ("DeviceClassifier", "DefaultDeviceClassifier"),
+    "classify",
 )
 
-_TxClassifierClass = _resolve_class(
-    module_path="core.eqc.classifiers.tx_classifier",
-    preferred_names=["TxClassifier", "TransactionClassifier", "DefaultTxClassifier"],
-    required_method="classify",
+_TX_CLASSIFIER_SPEC = (
+    "core.eqc.classifiers.tx_classifier",
+    ("TxClassifier", "TransactionClassifier", "DefaultTxClassifier"),
+    "classify",
 )
 
+_DEFAULT_CLASS_SPECS = {
+    "_PolicyClass": _POLICY_SPEC,
+    "_DeviceClassifierClass": _DEVICE_CLASSIFIER_SPEC,
+    "_TxClassifierClass": _TX_CLASSIFIER_SPEC,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    PEP 562: `_PolicyClass`, `_DeviceClassifierClass` and `_TxClassifierClass`
+    resolve on first access and are then stored as plain module globals.
+    """
+    spec = _DEFAULT_CLASS_SPECS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = _resolve_class(*spec)
+    globals()[name] = cls
+    return cls
+
+
+def _default_class(name: str) -> Type:
+    # In-module name lookups bypass module __getattr__, so route through it.
+    cls = globals().get(name)
+    return cls if cls is not None else __getattr__(name)
+
 
 # --- Public types -------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EQCDecision:
+    """
+    Result of EQCEngine.decide(). Immutable once returned; slotted because
+    decisions are kept in audit/journal buffers in bulk.
+    """
+
     context_hash: str
     verdict: Verdict
     signals: Dict[str, Any]
@@ -191,6 +331,9 @@ class EQCDecision:
 # --- Engine ------------------------------------------------------------------
 
 
+_NO_VERDICTS: Tuple[Verdict, ...] = ()
+
+
 class EQCEngine:
     """
     EQC decision brain.
@@ -209,190 +352,210 @@ class EQCEngine:
         tx_classifier: Optional[Any] = None,
         policy_registry: Optional[PolicyPackRegistry] = None,
         enabled_policy_packs: Optional[Sequence[str]] = None,
+        *,
+        audit_denied_packs: bool = False,
+        strict_policy_signature: bool = False,
     ):
-        self._policy = policy or _PolicyClass()
-        self._device = device_classifier or _DeviceClassifierClass()
-        self._tx = tx_classifier or _TxClassifierClass()
-
+        self._policy = policy or _default_class("_PolicyClass")()
+        self._device = device_classifier or _default_class("_DeviceClassifierClass")()
+        self._tx = tx_classifier or _default_class("_TxClassifierClass")()
         self._policy_registry = policy_registry or PolicyPackRegistry()
 
+        # Bound once here so decide() does no per-call method lookups.
+        # strict_policy_signature: the caller guarantees
+        # policy.evaluate(context, device_signals, tx_signals) positionally, so the
+        # bound method is called directly with no adapter frame. Policies with
+        # any other signature (including the default EQCPolicy) must leave it off.
+        self._policy_evaluate = (
+            self._policy.evaluate if strict_policy_signature else _policy_evaluate_adapter(self._policy)
+        )
+        self._device_classify = self._device.classify
+        self._tx_classify = self._tx.classify
+        self._registry_evaluate = self._policy_registry.evaluate
+
         # If enabled_policy_packs is not provided, read from EQC_POLICY_PACKS env var.
         if enabled_policy_packs is None:
-            self._enabled_policy_packs = _parse_policy_packs_env()
-        else:
-            self._enabled_policy_packs = list(enabled_policy_packs)
+            enabled_policy_packs = _parse_policy_packs_env()
+
+        # Insertion-ordered set: O(1) membership, and packs still run in the
+        # order they were enabled (a plain set would make merge order vary
+        # with the hash seed).
+        self._enabled_policy_packs: Dict[str, None] = dict.fromkeys(enabled_policy_packs)
+
+        # DENY is absorbing under the merge, so packs are skipped once the base
+        # policy denies. Set audit_denied_packs=True to still run them and keep
+        # their reasons on the final verdict.
+        self._audit_denied_packs = audit_denied_packs
 
     def decide(self, context: EQCContext) -> EQCDecision:
-        # --- Hard invariants (must be true even if policies change) -----
+        # Every decision carries the hash; compute it once (memoized on the context).
+        ctx_hash = context.context_hash()
 
-        device_type = (getattr(context.device, "device_type", None) or "").lower()
-        action_name = (getattr(context.action, "action", None) or "").lower()
-        asset_name = (getattr(context.action, "asset", None) or "").lower()
+        # --- Hard invariants (must be true even if policies change) -----
 
-        # Pull ReasonCode safely (tests check these exact codes)
-        try:
-            from core.eqc.verdicts import ReasonCode  # type: ignore
-        except Exception:
-            ReasonCode = None  # type: ignore
-
-        # 1) Browser is structurally denied
-        if device_type == "browser":
-            code = getattr(ReasonCode, "BROWSER_CONTEXT_BLOCKED", None) if ReasonCode else None
-            verdict = _make_verdict(
-                VerdictType.DENY,
-                "Execution denied: browser context is not permitted.",
-                {"device_type": device_type},
-                reason_code=code,
-            )
-            return EQCDecision(
-                context_hash=context.context_hash(),
-                verdict=verdict,
-                signals={"invariant": "HOSTILE_RUNTIME", "device_type": device_type},
-            )
+        # Lowercased once at context construction.
+        device_type = context.norm_device_type
+        action_name = context.norm_action
+        asset_name = context.norm_asset
 
-        # 2) Extension is structurally denied
-        if device_type == "extension":
-            code = getattr(ReasonCode, "EXTENSION_CONTEXT_BLOCKED", None) if ReasonCode else None
-            verdict = _make_verdict(
-                VerdictType.DENY,
-                "Execution denied: extension context is not permitted.",
-                {"device_type": device_type},
-                reason_code=code,
-            )
+        # 1) Browser / extension are structurally denied
+        verdict = _HOSTILE_RUNTIME_VERDICTS.get(device_type)
+        if verdict is not None:
             return EQCDecision(
-                context_hash=context.context_hash(),
+                context_hash=ctx_hash,
                 verdict=verdict,
                 signals={"invariant": "HOSTILE_RUNTIME", "device_type": device_type},
             )
 
-        # 3) DigiDollar mint/redeem requires step-up (must provide requirements)
-        if action_name in {"mint", "redeem"} and asset_name in {"digidollar", "dd"}:
-            code = (
-                getattr(ReasonCode, "MINT_REDEEM_REQUIRES_STEP_UP", None)
-                if ReasonCode
-                else None
-            )
-            verdict = _make_verdict(
-                VerdictType.STEP_UP,
-                "Step-up required: DigiDollar mint/redeem requires additional confirmation.",
-                {"action": action_name, "asset": asset_name},
-                reason_code=code,
-            )
-            verdict = _attach_step_up(verdict, requirements=["confirm_user_intent"])
+        # 2) DigiDollar mint/redeem requires step-up (must provide requirements).
+        # Two set probes gate the table, so ordinary actions build no key tuple.
+        if action_name in _DD_ACTIONS and asset_name in _DD_ASSETS:
             return EQCDecision(
-                context_hash=context.context_hash(),
-                verdict=verdict,
+                context_hash=ctx_hash,
+                verdict=_DD_STEP_UP_VERDICTS[(action_name, asset_name)],
                 signals={"invariant": "DD_STEP_UP", "action": action_name, "asset": asset_name},
             )
 
         # --- Classify ---------------------------------------------------
 
-        device_signals = self._device.classify(context)
-        tx_signals = self._tx.classify(context)
+        device_signals = self._device_classify(context)
+        tx_signals = self._tx_classify(context)
 
         # --- Base policy (adaptive call) --------------------------------
 
-        base_verdict: Verdict = _call_policy_evaluate(
-            self._policy,
-            context=context,
-            device_signals=device_signals,
-            tx_signals=tx_signals,
-        )
+        base_verdict: Verdict = self._policy_evaluate(context, device_signals, tx_signals)
 
         # --- Optional policy packs (opt-in) -----------------------------
 
-        pack_verdicts: List[Verdict] = self._policy_registry.evaluate(
-            context=context,
-            enabled=self._enabled_policy_packs,
-            device_signals=device_signals,
-            tx_signals=tx_signals,
+        # Skip the registry when no packs are enabled (the default) or when
+        # the base verdict is already DENY and no pack can change it.
+        enabled = self._enabled_policy_packs
+        if enabled and base_verdict.type == _DENY and not self._audit_denied_packs:
+            enabled = {}
+        pack_verdicts: Sequence[Verdict] = (
+            self._registry_evaluate(
+                context=context,
+                enabled=enabled,
+                device_signals=device_signals,
+                tx_signals=tx_signals,
+            )
+            if enabled
+            else _NO_VERDICTS
         )
 
         # --- Merge verdicts ---------------------------------------------
 
-        final_verdict = _merge_verdicts([base_verdict] + pack_verdicts)
+        if pack_verdicts:
+            final_verdict = _merge_verdicts(base_verdict, pack_verdicts)
+            pack_types: List[Any] = [v.type for v in pack_verdicts]
+        elif base_verdict.reasons:
+            # Nothing to merge: a single verdict with reasons is already final.
+            # (Packs may only tighten, so this is never taken when packs spoke.)
+            final_verdict = base_verdict
+            pack_types = []
+        else:
+            final_verdict = _merge_verdicts(base_verdict)
+            pack_types = []
 
         signals = {
             "device": device_signals,
             "tx": tx_signals,
-            "policy_packs": [getattr(v, "type", None) for v in pack_verdicts],
+            "policy_packs": pack_types,
         }
 
         return EQCDecision(
-            context_hash=context.context_hash(),
+            context_hash=ctx_hash,
             verdict=final_verdict,
             signals=signals,
         )
 
+    def decide_batch(self, contexts: Iterable[EQCContext]) -> List[EQCDecision]:
+        """
+        Decide many contexts (replay, audit, backtest), in input order.
+
+        Each context goes through the full decide() path, invariants
+        included; the loop only hoists the method lookup.
+        """
+        decide = self.decide
+        return [decide(context) for context in contexts]
+
     def enable_policy_pack(self, name: str) -> None:
-        if name not in self._enabled_policy_packs:
-            self._enabled_policy_packs.append(name)
+        self._enabled_policy_packs.setdefault(name)
 
     def disable_policy_pack(self, name: str) -> None:
-        self._enabled_policy_packs = [n for n in self._enabled_policy_packs if n != name]
+        self._enabled_policy_packs.pop(name, None)
 
     @property
     def policy_registry(self) -> PolicyPackRegistry:
         return self._policy_registry
 
 
-def _merge_verdicts(verdicts: List[Verdict]) -> Verdict:
+# Local bindings: skip enum attribute lookups inside the merge loop.
+_DENY = VerdictType.DENY
+_STEP_UP = VerdictType.STEP_UP
+_ALLOW = VerdictType.ALLOW
+
+
+def _merge_verdicts(base: Verdict, extras: Sequence[Verdict] = ()) -> Verdict:
     """
-    Merge verdicts deterministically with correct Verdict structure.
+    Merge the base verdict with any extra (policy pack) verdicts
+    deterministically, with correct Verdict structure.
 
     Priority:
       DENY > STEP_UP > ALLOW
 
+    Single pass: once a higher-priority type has been seen, reasons of
+    lower-priority verdicts are no longer collected. Reasons of every
+    verdict of the winning type are kept, in input order.
+
     IMPORTANT:
     Preserve STEP_UP payload (verdict.step_up) when STEP_UP wins, otherwise
     tests may see the class staticmethod Verdict.step_up (a function) instead of
     the instance field step_up (an object with .requirements).
     """
-    if not verdicts:
-        return _make_verdict(VerdictType.DENY, "No verdicts produced by EQC.")
-
-    def _reasons(v: Verdict) -> List[Any]:
-        r = getattr(v, "reasons", None)
-        return list(r) if r else []
-
-    def _first_step_up(vs: List[Verdict]):
-        for v in vs:
-            su = getattr(v, "step_up", None)
-            # Ignore callable (classmethod/staticmethod fallback)
-            if su is not None and not callable(su):
-                return su
-        return None
+    deny: Optional[List[Any]] = None
+    step: Optional[List[Any]] = None
+    allow: Optional[List[Any]] = None
+    step_up_obj = None
+
+    for v in chain((base,), extras):
+        t = v.type
+        if t == _DENY:
+            if deny is None:
+                deny = []
+            deny.extend(v.reasons or ())
+        elif deny is not None:
+            continue
+        elif t == _STEP_UP:
+            if step is None:
+                step = []
+            step.extend(v.reasons or ())
+            if step_up_obj is None:
+                su = getattr(v, "step_up", None)
+                # Ignore callable (classmethod/staticmethod fallback)
+                if su is not None and not callable(su):
+                    step_up_obj = su
+        elif t == _ALLOW and step is None:
+            if allow is None:
+                allow = []
+            allow.extend(v.reasons or ())
 
     # DENY
-    if any(v.type == VerdictType.DENY for v in verdicts):
-        chosen = [v for v in verdicts if v.type == VerdictType.DENY]
-        merged: List[Any] = []
-        for v in chosen:
-            merged.extend(_reasons(v))
-        if not merged:
-            merged = [_safe_reason("Denied by EQC policy evaluation.", {})]
-        return Verdict(type=VerdictType.DENY, reasons=merged)  # type: ignore[arg-type]
+    if deny is not None:
+        if not deny:
+            deny = [_safe_reason("Denied by EQC policy evaluation.", {})]
+        return Verdict(type=VerdictType.DENY, reasons=deny)  # type: ignore[arg-type]
 
     # STEP_UP
-    if any(v.type == VerdictType.STEP_UP for v in verdicts):
-        chosen = [v for v in verdicts if v.type == VerdictType.STEP_UP]
-        merged: List[Any] = []
-        for v in chosen:
-            merged.extend(_reasons(v))
-        if not merged:
-            merged = [_safe_reason("Step-up required by EQC policy evaluation.", {})]
-
-        step_up_obj = _first_step_up(chosen)
-        return Verdict(type=VerdictType.STEP_UP, reasons=merged, step_up=step_up_obj)  # type: ignore[arg-type]
+    if step is not None:
+        if not step:
+            step = [_safe_reason("Step-up required by EQC policy evaluation.", {})]
+        return Verdict(type=VerdictType.STEP_UP, reasons=step, step_up=step_up_obj)  # type: ignore[arg-type]
 
     # ALLOW
-    chosen = [v for v in verdicts if v.type == VerdictType.ALLOW]
-    if chosen:
-        merged: List[Any] = []
-        for v in chosen:
-            merged.extend(_reasons(v))
-        if not merged:
-            merged = [_safe_reason("Allowed by EQC policy evaluation.", {})]
-        return Verdict(type=VerdictType.ALLOW, reasons=merged)  # type: ignore[arg-type]
-
-    return verdicts[0]
+    if allow is not None:
+        if not allow:
+            allow = [_safe_reason("Allowed by EQC policy evaluation.", {})]
+        return Verdict(type=VerdictType.ALLOW, reasons=allow)  # type: ignore[arg-type]
+
+    return base
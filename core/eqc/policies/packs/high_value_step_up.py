@@ -13,13 +13,20 @@ License: MIT (see root LICENSE)
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from core.eqc.context import EQCContext
 from core.eqc.policies.types import PolicyPack
 from core.eqc.verdicts import Verdict, VerdictType, StepUp, Reason, ReasonCode
 
 
+# Shared result for the common no-match path. Verdict is frozen and an
+# empty reasons tuple leaves nothing for a caller to mutate.
+_ALLOW = Verdict(type=VerdictType.ALLOW, reasons=())  # type: ignore[arg-type]
+
+_REQUIREMENTS = ("confirm_user_intent",)
+
+
 class HighValueStepUpPack(PolicyPack):
     """
     Require STEP_UP for high-value sends.
@@ -39,6 +46,21 @@ class HighValueStepUpPack(PolicyPack):
     ):
         super().__init__(name=name, rules=list(rules or []))
         self.threshold = int(threshold)
+        self._step_up_cache: Optional[Tuple[int, StepUp]] = None
+
+    def _step_up(self) -> StepUp:
+        # StepUp is frozen and depends only on the threshold: build it once
+        # per threshold value instead of on every high-value send. It is
+        # shared by every verdict, so requirements stays a tuple.
+        cached = self._step_up_cache
+        if cached is None or cached[0] != self.threshold:
+            step = StepUp(
+                requirements=_REQUIREMENTS,  # type: ignore[arg-type]
+                message=f"High-value send requires confirmation (>= {self.threshold}).",
+            )
+            cached = (self.threshold, step)
+            self._step_up_cache = cached
+        return cached[1]
 
     def evaluate(
         self,
@@ -49,27 +71,23 @@ class HighValueStepUpPack(PolicyPack):
     ) -> Verdict:
         # NOTE: device_signals / tx_signals are accepted for registry compatibility.
         # This pack currently does not use them; it only tightens based on amount.
-        a = context.action
+        # Only apply to "send" (action is lowercased at context construction)
+        if context.norm_action != "send":
+            return _ALLOW
 
-        # Only apply to "send"
-        if (a.action or "").lower() != "send":
-            return Verdict.allow()
+        amount = context.action.amount
+        if amount is None:
+            return _ALLOW
 
-        if a.amount is None:
-            return Verdict.allow()
-
-        try:
-            amount = int(a.amount)
-        except Exception:
-            return Verdict.allow()
+        # Amounts are almost always plain ints; only convert anything else.
+        if type(amount) is not int:
+            try:
+                amount = int(amount)
+            except Exception:
+                return _ALLOW
 
         if amount < self.threshold:
-            return Verdict.allow()
-
-        step = StepUp(
-            requirements=["confirm_user_intent"],
-            message=f"High-value send requires confirmation (>= {self.threshold}).",
-        )
+            return _ALLOW
 
         reason = Reason(
             code=ReasonCode.LARGE_AMOUNT,
@@ -80,5 +98,5 @@ class HighValueStepUpPack(PolicyPack):
         return Verdict(
             type=VerdictType.STEP_UP,
             reasons=[reason],
-            step_up=step,
+            step_up=self._step_up(),
         )
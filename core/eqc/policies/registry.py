@@ -13,7 +13,8 @@ License: MIT (see root LICENSE)
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
 import importlib
 
 
@@ -38,21 +39,15 @@ class PolicyPackObject(Protocol):
 PolicyPack = Any  # callable or object with .evaluate
 
 
-def _resolve_pack_ref(ref: str) -> PolicyPack:
+@lru_cache(maxsize=256)
+def _resolve_pack_target(ref: str) -> Any:
     """
-    Resolve a pack reference like:
-      - "pkg.module:PackClass"
-      - "pkg.module:pack_instance"
-      - "pkg.module.pack_callable"   (fallback)
+    Import and return the attribute a pack reference names (class, instance
+    or callable), without instantiating it.
 
-    Returns:
-      - an object with .evaluate(...) OR
-      - a callable(context, device_signals=..., tx_signals=...)
+    Memoized per ref string, so workers/registries that load the same ref
+    skip the parse and the import system. Failures are not cached.
     """
-    ref = (ref or "").strip()
-    if not ref:
-        raise ValueError("Empty policy pack reference")
-
     module_name: str
     attr_name: Optional[str] = None
 
@@ -76,8 +71,27 @@ def _resolve_pack_ref(ref: str) -> PolicyPack:
     obj = getattr(mod, attr_name, None)
     if obj is None:
         raise ImportError(f"Policy pack attribute not found: {ref!r}")
+    return obj
 
-    # If it's a class, instantiate.
+
+def _resolve_pack_ref(ref: str) -> PolicyPack:
+    """
+    Resolve a pack reference like:
+      - "pkg.module:PackClass"
+      - "pkg.module:pack_instance"
+      - "pkg.module.pack_callable"   (fallback)
+
+    Returns:
+      - an object with .evaluate(...) OR
+      - a callable(context, device_signals=..., tx_signals=...)
+    """
+    ref = (ref or "").strip()
+    if not ref:
+        raise ValueError("Empty policy pack reference")
+
+    obj = _resolve_pack_target(ref)
+
+    # If it's a class, instantiate (a fresh instance per resolution, as before).
     if isinstance(obj, type):
         return obj()
 
@@ -85,6 +99,17 @@ def _resolve_pack_ref(ref: str) -> PolicyPack:
     return obj
 
 
+def _bind_evaluate(pack: PolicyPack) -> Callable[..., Any]:
+    """
+    Return the callable to invoke for a pack: its bound .evaluate if it has
+    one, otherwise the pack itself.
+    """
+    fn = getattr(pack, "evaluate", None)
+    if fn is not None and callable(fn):
+        return fn
+    return pack
+
+
 class PolicyPackRegistry:
     """
     Registry mapping `name` -> pack object/callable.
@@ -95,44 +120,62 @@ class PolicyPackRegistry:
 
     def __init__(self) -> None:
         self._packs: Dict[str, PolicyPack] = {}
+        # name -> callable resolved once at registration (bound evaluate or the pack)
+        self._dispatch: Dict[str, Callable[..., Any]] = {}
 
     def register_pack(self, name: str, pack: PolicyPack) -> None:
         name = (name or "").strip()
         if not name:
             raise ValueError("Policy pack name cannot be empty")
         self._packs[name] = pack
+        self._dispatch[name] = _bind_evaluate(pack)
 
     def _ensure_loaded(self, ref: str) -> None:
-        ref = (ref or "").strip()
-        if not ref:
-            return
+        # `ref` is already stripped and non-empty (see batch_evaluate).
         if ref in self._packs:
             return
         pack = _resolve_pack_ref(ref)
         self.register_pack(ref, pack)
 
-    def evaluate(self, context: Any, *, enabled: List[str], device_signals: Any, tx_signals: Any) -> List[Any]:
+    def evaluate(self, context: Any, *, enabled: Iterable[str], device_signals: Any, tx_signals: Any) -> List[Any]:
         """
         Run all enabled packs and return a list of Verdict-like objects.
         """
-        verdicts: List[Any] = []
-        for ref in enabled or []:
-            ref = (ref or "").strip()
-            if not ref:
-                continue
-
-            self._ensure_loaded(ref)
-            pack = self._packs.get(ref)
-            if pack is None:
-                continue
-
-            # object with evaluate(...)
-            if hasattr(pack, "evaluate") and callable(getattr(pack, "evaluate")):
-                out = pack.evaluate(context, device_signals=device_signals, tx_signals=tx_signals)
-            else:
-                # callable pack(...)
-                out = pack(context, device_signals=device_signals, tx_signals=tx_signals)
+        return self.batch_evaluate(
+            context,
+            enabled=enabled,
+            device_signals=device_signals,
+            tx_signals=tx_signals,
+        )
+
+    def batch_evaluate(
+        self, context: Any, *, enabled: Iterable[str], device_signals: Any, tx_signals: Any
+    ) -> List[Any]:
+        """
+        Evaluate every enabled pack in one call, in `enabled` order.
 
+        Dispatch targets are resolved at registration, so the loop does no
+        per-pack attribute probing. Registries that can share work across
+        packs (e.g. a risk score several packs read) override this method.
+        """
+        verdicts: List[Any] = []
+        dispatch = self._dispatch
+        for ref in enabled or ():
+            # Hot path: a clean, already-registered ref is one dict probe.
+            fn = dispatch.get(ref)
+            if fn is None:
+                ref = (ref or "").strip()
+                if not ref:
+                    continue
+                fn = dispatch.get(ref)
+            if fn is None:
+                self._ensure_loaded(ref)
+                pack = self._packs.get(ref)
+                if pack is None:
+                    continue
+                fn = dispatch[ref] = _bind_evaluate(pack)
+
+            out = fn(context, device_signals=device_signals, tx_signals=tx_signals)
             if out is not None:
                 verdicts.append(out)
 
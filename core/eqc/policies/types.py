@@ -11,7 +11,7 @@ License: MIT (see root LICENSE)
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Iterable, Protocol, runtime_checkable
+from typing import Any, Callable, Iterable, List, Protocol, runtime_checkable
 
 from core.eqc.context import EQCContext
 from core.eqc.verdicts import Verdict
@@ -46,9 +46,20 @@ class PolicyPack:
     name: str
     rules: Iterable[PolicyRule]
 
-    def evaluate(self, context: EQCContext) -> Iterable[Verdict]:
+    def evaluate(self, context: EQCContext) -> List[Verdict]:
         """
         Evaluate all rules in this pack against the given context.
+
+        Returns one verdict per rule, in rule order.
+        """
+        return [rule.evaluate(context) for rule in self.rules]
+
+    def evaluate_batch(self, contexts: Iterable[EQCContext]) -> List[Any]:
+        """
+        Evaluate this pack over many contexts (replay, audit, backtest).
+
+        Returns one evaluate() result per context, in input order. Packs
+        that can share work across a batch override this.
         """
-        for rule in self.rules:
-            yield rule.evaluate(context)
+        evaluate = self.evaluate
+        return [evaluate(context) for context in contexts]
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from base64 import urlsafe_b64encode
 from dataclasses import dataclass
 import secrets
 import time
-from typing import Optional
+from typing import List, Optional, Sequence
+
+
+# Entropy per capability token (same as secrets.token_urlsafe(32)).
+_TOKEN_BYTES = 32
 
 
 @dataclass(frozen=True)
@@ -48,8 +53,40 @@ def issue_runtime_capability(
     """
     ts = int(time.time()) if issued_at is None else int(issued_at)
     return RuntimeCapability(
-        token=secrets.token_urlsafe(32),
+        token=secrets.token_urlsafe(_TOKEN_BYTES),
         scope_hash=scope_hash,
         issued_at=ts,
         ttl_seconds=ttl_seconds,
     )
+
+
+def issue_runtime_capabilities(
+    *,
+    scope_hashes: Sequence[str],
+    ttl_seconds: Optional[int] = None,
+    issued_at: Optional[int] = None,
+) -> List[RuntimeCapability]:
+    """Mint one capability per scope hash in a single batch.
+
+    Tokens have the same format and entropy as issue_runtime_capability(),
+    but the batch makes one random read and one clock read in total.
+
+    Args:
+        scope_hashes: WSQK scope hashes, one capability each (in order).
+        ttl_seconds: Optional TTL (seconds) applied to every capability.
+        issued_at: Optional override for deterministic tests.
+    """
+    n = len(scope_hashes)
+    if n == 0:
+        return []
+    ts = int(time.time()) if issued_at is None else int(issued_at)
+    raw = secrets.token_bytes(_TOKEN_BYTES * n)
+    return [
+        RuntimeCapability(
+            token=urlsafe_b64encode(raw[i * _TOKEN_BYTES:(i + 1) * _TOKEN_BYTES]).rstrip(b"=").decode("ascii"),
+            scope_hash=scope_hash,
+            issued_at=ts,
+            ttl_seconds=ttl_seconds,
+        )
+        for i, scope_hash in enumerate(scope_hashes)
+    ]
@@ -53,6 +53,12 @@ class WalletIntent:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
+# Actions that must route through the signing gate.
+_SIGNING_LIKE_ACTIONS = frozenset({"sign", "send", "transfer", "mint", "message_sign"})
+# Signing-like actions that also require to_address + amount_minor.
+_SEND_LIKE_ACTIONS = frozenset({"send", "transfer"})
+
+
 def _to_signing_intent(intent: WalletIntent) -> SigningIntent:
     """Map WalletIntent -> SigningIntent for signing-like operations."""
     return SigningIntent(
@@ -66,7 +72,7 @@ def _to_signing_intent(intent: WalletIntent) -> SigningIntent:
         device_type=intent.device_type,
         platform=intent.platform,
         network_type=intent.network_type,
-        extra=dict(intent.extra),
+        extra=intent.extra,  # SigningIntent takes its own read-only copy
     )
 
 
@@ -100,19 +106,11 @@ def execute_intent(
     action = intent.action.strip().lower()
 
     # Signing-like operations MUST go through the signing gate
-    signing_like = {
-        "sign",
-        "send",
-        "transfer",
-        "mint",
-        "message_sign",
-    }
-
-    if action in signing_like:
+    if action in _SIGNING_LIKE_ACTIONS:
         s_intent = _to_signing_intent(intent)
 
         # Basic validation for send/transfer patterns
-        if action in {"send", "transfer"}:
+        if action in _SEND_LIKE_ACTIONS:
             if not s_intent.to_address or s_intent.amount_minor is None:
                 raise ValueError("send/transfer requires to_address and amount_minor")
 
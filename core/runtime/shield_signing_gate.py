@@ -8,9 +8,13 @@ License: MIT (see root LICENSE)
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional, Tuple
+from operator import attrgetter
 import hashlib
 import json
+import os
+import threading
 
 from core.eqc import EQCEngine
 from core.eqc.context import (
@@ -19,7 +23,10 @@ from core.eqc.context import (
     DeviceContext,
     NetworkContext,
     UserContext,
+    freeze_value,
+    thaw_value,
 )
+from core.eqc.verdicts import VerdictType
 from core.runtime.orchestrator import ExecutionBlocked
 from core.runtime.capabilities import issue_runtime_capability
 from core.wsqk.context_bind import bind_scope_from_eqc
@@ -45,29 +52,64 @@ class SigningIntent:
     platform: str = "ios"
     network_type: str = "unknown"
     user_id: str = "user"
-    extra: Dict[str, Any] = field(default_factory=dict)
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
+    # Memoized intent_hash() (the intent is immutable once built).
+    _cached_hash: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+
+    # Lowercased action, derived once (mirrors EQCContext.norm_action).
+    # Not part of equality or the intent hash.
+    norm_action: str = field(default="", init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Deep read-only copy, so later changes to the caller's dict (or
+        # anything nested in it) cannot alter the intent or its cached hash.
+        object.__setattr__(self, "extra", freeze_value(self.extra))
+        object.__setattr__(self, "norm_action", self.action.lower())
 
     def intent_hash(self) -> str:
-        """Deterministic hash of the intent for audit + binding across layers."""
-        payload = {
-            "wallet_id": self.wallet_id,
-            "account_id": self.account_id,
-            "action": self.action,
-            "asset": self.asset,
-            "amount": self.amount,
-            "recipient": self.recipient,
-            "to_address": self.to_address,
-            "amount_minor": self.amount_minor,
-            "device_type": self.device_type,
-            "platform": self.platform,
-            "network_type": self.network_type,
-            "user_id": self.user_id,
-            "extra": dict(self.extra),
-        }
-        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        """
+        Deterministic hash of the intent for audit + binding across layers.
+
+        Computed once per instance and cached.
+        """
+        h = self._cached_hash
+        if h is None:
+            h = self._compute_hash()
+            object.__setattr__(self, "_cached_hash", h)
+        return h
+
+    def _compute_hash(self) -> str:
+        blob = _encode_intent([_INTENT_CANONICAL_VERSION, _INTENT_VALUES(self), thaw_value(self.extra)])
         return hashlib.sha256(blob.encode("utf-8")).hexdigest()
 
 
+# Canonical intent encoding: a JSON array of the fields in fixed order
+# (no payload dict, no top-level key sort), then the key-sorted extra.
+# Bump the version if the field list or encoding changes.
+_INTENT_CANONICAL_VERSION = "SIGN-INTENT-1"
+_INTENT_FIELDS = (
+    "wallet_id",
+    "account_id",
+    "action",
+    "asset",
+    "amount",
+    "recipient",
+    "to_address",
+    "amount_minor",
+    "device_type",
+    "platform",
+    "network_type",
+    "user_id",
+)
+_INTENT_VALUES = attrgetter(*_INTENT_FIELDS)
+_encode_intent = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode
+
+
+# Actions the default evaluator forwards to Shield's send_dgb check.
+_SHIELD_SEND_ACTIONS = frozenset({"send", "send_dgb", "transfer"})
+
+
 class ShieldEvaluator:
     def evaluate(self, intent: SigningIntent) -> ShieldDecision:  # pragma: no cover
         raise NotImplementedError
@@ -81,7 +123,7 @@ class DefaultShieldEvaluator(ShieldEvaluator):
         ih = intent.intent_hash()
 
         if (
-            intent.action.lower() in {"send", "send_dgb", "transfer"}
+            intent.norm_action in _SHIELD_SEND_ACTIONS
             and intent.to_address
             and intent.amount_minor is not None
         ):
@@ -99,7 +141,35 @@ class DefaultShieldEvaluator(ShieldEvaluator):
         return ShieldDecision.allow(reason=f"shield_gate_default_allow:{ih}")
 
 
+# extra keys that feed each sub-context. When an intent sets none of them,
+# the sub-context depends only on intent fields, and (being frozen) one
+# shared instance per field value serves every intent.
+_DEVICE_EXTRA_KEYS = frozenset({"device_id", "device_trusted", "app_version"})
+_NETWORK_EXTRA_KEYS = frozenset({"node_type", "node_trusted", "entropy_score", "fee_rate", "peer_count"})
+_USER_EXTRA_KEYS = frozenset({"biometric_available", "pin_set"})
+
+
+@lru_cache(maxsize=64)
+def _plain_device_context(device_type: str, os: str) -> DeviceContext:
+    return DeviceContext(device_id="device", device_type=device_type, os=os)
+
+
+@lru_cache(maxsize=16)
+def _plain_network_context(network: str) -> NetworkContext:
+    return NetworkContext(network=network)
+
+
+@lru_cache(maxsize=256)
+def _plain_user_context(user_id: str) -> UserContext:
+    return UserContext(user_id=user_id)
+
+
 def _build_eqc_context(intent: SigningIntent) -> EQCContext:
+    # intent.extra is already a private read-only copy: read it in place,
+    # one lookup per key.
+    extra = intent.extra
+    get = extra.get
+
     action = ActionContext(
         action=intent.action,
         asset=intent.asset,
@@ -107,35 +177,82 @@ def _build_eqc_context(intent: SigningIntent) -> EQCContext:
         recipient=intent.recipient or intent.to_address,
     )
 
-    device = DeviceContext(
-        device_id=str(intent.extra.get("device_id", "device")),
-        device_type=intent.device_type,
-        os=intent.platform,
-        trusted=bool(intent.extra.get("device_trusted", False)),
-        app_version=str(intent.extra.get("app_version", "")) or None,
+    keys = extra.keys()
+
+    if keys.isdisjoint(_DEVICE_EXTRA_KEYS):
+        device = _plain_device_context(intent.device_type, intent.platform)
+    else:
+        device = DeviceContext(
+            device_id=str(get("device_id", "device")),
+            device_type=intent.device_type,
+            os=intent.platform,
+            trusted=bool(get("device_trusted", False)),
+            app_version=str(get("app_version", "")) or None,
+        )
+
+    if keys.isdisjoint(_NETWORK_EXTRA_KEYS):
+        network = _plain_network_context(intent.network_type or "mainnet")
+    else:
+        entropy_score = get("entropy_score")
+        network = NetworkContext(
+            network=intent.network_type or "mainnet",
+            node_type=str(get("node_type", "")) or None,
+            node_trusted=bool(get("node_trusted", False)),
+            entropy_score=float(entropy_score) if entropy_score is not None else None,
+            fee_rate=get("fee_rate"),
+            peer_count=get("peer_count"),
+        )
+
+    if keys.isdisjoint(_USER_EXTRA_KEYS):
+        user = _plain_user_context(intent.user_id)
+    else:
+        user = UserContext(
+            user_id=intent.user_id,
+            biometric_available=bool(get("biometric_available", False)),
+            pin_set=bool(get("pin_set", False)),
+        )
+
+    # EQCContext takes its own sorted read-only copy; build its input once.
+    return EQCContext(
+        action=action,
+        device=device,
+        network=network,
+        user=user,
+        extra={**extra, "intent_hash": intent.intent_hash()},
     )
 
-    network = NetworkContext(
-        network=intent.network_type or "mainnet",
-        node_type=str(intent.extra.get("node_type", "")) or None,
-        node_trusted=bool(intent.extra.get("node_trusted", False)),
-        entropy_score=float(intent.extra.get("entropy_score"))
-        if intent.extra.get("entropy_score") is not None
-        else None,
-        fee_rate=intent.extra.get("fee_rate"),
-        peer_count=intent.extra.get("peer_count"),
-    )
 
-    user = UserContext(
-        user_id=intent.user_id,
-        biometric_available=bool(intent.extra.get("biometric_available", False)),
-        pin_set=bool(intent.extra.get("pin_set", False)),
-    )
+# Process-wide defaults for callers that pass no engine/evaluator, built
+# lazily (double-checked under a lock). Both are stateless per decision.
+# EQCEngine() reads EQC_POLICY_PACKS at construction, so the cached engine
+# is keyed by that value and rebuilt if it changes.
+_defaults_lock = threading.Lock()
+_default_eqc_engine: Optional[Tuple[str, EQCEngine]] = None
+_default_shield_evaluator: Optional[DefaultShieldEvaluator] = None
+
+
+def _default_eqc() -> EQCEngine:
+    global _default_eqc_engine
+    packs = os.environ.get("EQC_POLICY_PACKS") or ""
+    cached = _default_eqc_engine
+    if cached is None or cached[0] != packs:
+        with _defaults_lock:
+            cached = _default_eqc_engine
+            if cached is None or cached[0] != packs:
+                cached = (packs, EQCEngine())
+                _default_eqc_engine = cached
+    return cached[1]
 
-    extra = dict(intent.extra)
-    extra["intent_hash"] = intent.intent_hash()
 
-    return EQCContext(action=action, device=device, network=network, user=user, extra=extra)
+def _default_shield() -> DefaultShieldEvaluator:
+    global _default_shield_evaluator
+    shield = _default_shield_evaluator
+    if shield is None:
+        with _defaults_lock:
+            shield = _default_shield_evaluator
+            if shield is None:
+                shield = _default_shield_evaluator = DefaultShieldEvaluator()
+    return shield
 
 
 def execute_signing_intent(
@@ -168,23 +285,25 @@ def execute_signing_intent(
         if account_store.is_watch_only(intent.wallet_id, intent.account_id):
             raise ExecutionBlocked("watch-only account: signing is not permitted")
 
-    eqc = eqc_engine or EQCEngine()
-    shield_eval = shield or DefaultShieldEvaluator()
+    eqc = eqc_engine or _default_eqc()
+    shield_eval = shield or _default_shield()
 
     context = _build_eqc_context(intent)
     decision = eqc.decide(context)
 
-    try:
-        from core.eqc.verdicts import VerdictType
-    except Exception as e:  # pragma: no cover
-        raise ExecutionBlocked(f"EQC verdict import failed: {e}") from e
-
     if decision.verdict.type != VerdictType.ALLOW:
         raise ExecutionBlocked(f"EQC blocked signing intent: {decision.verdict.type}")
 
     sdec = shield_eval.evaluate(intent)
-    if getattr(sdec, "blocked", False):
-        raise ExecutionBlocked(f"Shield blocked signing intent: {getattr(sdec, 'reason', '')}")
+    # Direct access: a decision without `blocked` (or a block without a
+    # `reason`) is malformed and must fail closed, not read as "not blocked".
+    try:
+        blocked = sdec.blocked
+        reason = sdec.reason if blocked else ""
+    except AttributeError:
+        raise ExecutionBlocked("Shield returned a malformed decision (no 'blocked'/'reason')") from None
+    if blocked:
+        raise ExecutionBlocked(f"Shield blocked signing intent: {reason}")
 
     if not use_wsqk:
         return executor(context)
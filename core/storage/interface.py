@@ -14,8 +14,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional, Protocol
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Protocol, Tuple
 
 
 # -------------------------
@@ -31,11 +31,18 @@ class KeyNS:
     """
     prefix: str
 
-    def k(self, suffix: str) -> str:
+    # Normalized "PREFIX_" head, computed once ("" if the prefix is blank).
+    _head: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         p = self.prefix.strip().upper()
-        if not p:
+        object.__setattr__(self, "_head", f"{p}_" if p else "")
+
+    def k(self, suffix: str) -> str:
+        head = self._head
+        if not head:
             raise ValueError("KeyNS.prefix must be non-empty")
-        return f"{p}_{suffix}"
+        return f"{head}{suffix}"
 
 
 # -------------------------
@@ -117,3 +124,38 @@ class WalletStorage(ABC):
     def begin_batch(self) -> WalletBatch:
         """Start an atomic batch."""
         raise NotImplementedError
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Set several keys at once, atomically.
+
+        Backends SHOULD override this with one bulk write.
+        The default applies the items through a single begin_batch().
+        """
+        with self.begin_batch() as b:
+            for k, v in items:
+                b.put(k, v)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete several keys at once, atomically (missing keys are no-ops).
+
+        Backends SHOULD override this with one bulk delete.
+        The default applies the deletes through a single begin_batch().
+        """
+        with self.begin_batch() as b:
+            for k in keys:
+                b.delete(k)
+
+    def scan(self, prefix: str = "", batch_size: int = 512) -> Iterable[Tuple[str, Any]]:
+        """
+        Iterate (key, value) pairs for keys matching prefix.
+
+        Backends SHOULD override this with a single range read.
+        The default falls back to keys() + get() for compatibility.
+        batch_size is a hint for backends that fetch rows in chunks.
+        """
+        for k in self.keys(prefix=prefix):
+            v = self.get(k)
+            if v is not None:
+                yield k, v
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from threading import RLock
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Collection, Dict, Iterable, Iterator, Optional, Tuple
 
 from core.storage.interface import WalletBatch, WalletStorage
 
@@ -40,13 +40,7 @@ class _MemoryBatch(WalletBatch):
     def commit(self) -> None:
         if self._closed:
             return
-        with self._parent._lock:
-            # apply deletes first
-            for k in self._deletes:
-                self._parent._data.pop(k, None)
-            # then writes
-            for k, v in self._writes.items():
-                self._parent._data[k] = v
+        self._parent._apply(self._writes, self._deletes)
         self._closed = True
 
     def rollback(self) -> None:
@@ -63,6 +57,9 @@ class MemoryWalletStorage(WalletStorage):
 
     Notes:
     - Values are stored as-is (no serialization here)
+    - Reads (get/exists) take no lock: a single dict lookup is thread-safe
+      on both GIL and free-threaded CPython. Writes still hold the lock so
+      they cannot interleave with a batch commit.
     - Higher layers may serialize to dict/bytes if they want portability
     """
 
@@ -71,8 +68,7 @@ class MemoryWalletStorage(WalletStorage):
         self._lock = RLock()
 
     def get(self, key: str) -> Optional[Any]:
-        with self._lock:
-            return self._data.get(key)
+        return self._data.get(key)
 
     def put(self, key: str, value: Any) -> None:
         with self._lock:
@@ -82,15 +78,54 @@ class MemoryWalletStorage(WalletStorage):
         with self._lock:
             self._data.pop(key, None)
 
+    def _apply(self, writes: Dict[str, Any], deletes: Collection[str]) -> None:
+        """
+        Apply deletes, then writes, atomically with respect to lock-free readers.
+
+        Copy-on-write: the new state is built aside and published with one
+        reference swap, so a concurrent get() sees either none or all of the
+        change. That copy is O(store size) per call; a single-key change is
+        already atomic and is applied in place instead.
+        """
+        with self._lock:
+            if len(writes) + len(deletes) <= 1:
+                for k in deletes:
+                    self._data.pop(k, None)
+                self._data.update(writes)
+                return
+            data = dict(self._data)
+            for k in deletes:
+                data.pop(k, None)
+            data.update(writes)
+            self._data = data
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        self._apply(dict(items), ())
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        self._apply({}, set(keys))
+
     def exists(self, key: str) -> bool:
+        return key in self._data
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        # Generator over a snapshot taken under the lock, so callers may
+        # put/delete while iterating.
         with self._lock:
-            return key in self._data
+            snapshot = list(self._data)
+        if not prefix:
+            yield from snapshot
+            return
+        for k in snapshot:
+            if k.startswith(prefix):
+                yield k
 
-    def keys(self, prefix: str = "") -> Iterable[str]:
+    def scan(self, prefix: str = "", batch_size: int = 512) -> Iterable[Tuple[str, Any]]:
+        # single pass under the lock; no per-key get()
         with self._lock:
             if not prefix:
-                return list(self._data.keys())
-            return [k for k in self._data.keys() if k.startswith(prefix)]
+                return list(self._data.items())
+            return [(k, v) for k, v in self._data.items() if k.startswith(prefix)]
 
     def begin_batch(self) -> WalletBatch:
         return _MemoryBatch(self)
@@ -13,24 +13,110 @@ Purpose:
 from __future__ import annotations
 
 import json
+import math
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from threading import RLock
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
 
 from core.storage.interface import WalletBatch, WalletStorage
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
 
 def _encode(value: Any) -> str:
     # JSON is portable across clients/languages
+    if orjson is not None:
+        try:
+            text = orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            # non-str dict keys, ints beyond 64 bits, ...: stdlib handles these
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; json.dumps keeps them, so a
+            # record holding one must take the stdlib path to read back intact.
+            # Without a null in the output there is nothing to check.
+            if "null" not in text or not _has_non_finite(value):
+                return text
     return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
 def _decode(blob: str) -> Any:
+    # stdlib on purpose: orjson.loads turns ints beyond 64 bits into floats
     return json.loads(blob)
 
 
+# Applied once per connection, before the schema is created.
+# - WAL + synchronous=NORMAL: a commit appends to the WAL instead of
+#   fsync'ing the main DB; the DB stays consistent on power loss, only the
+#   last commits before a crash may be lost (synced at checkpoints).
+# - temp_store/mmap_size/cache_size: keep temp tables, reads and the page
+#   cache in memory (256 MiB mmap, 64 MiB cache).
+# In-memory databases silently keep journal_mode=memory.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Statements are module constants so every call sends the same text and
+# hits the connection's statement cache (keyed by SQL text; the default
+# cache size already holds every statement below).
+_SQL_CREATE = "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+_SQL_GET = "SELECT value FROM kv WHERE key = ?"
+_SQL_EXISTS = "SELECT 1 FROM kv WHERE key = ? LIMIT 1"
+_SQL_KEYS_RANGE = "SELECT key FROM kv WHERE key >= ? AND key < ? ORDER BY key LIMIT ?"
+_SQL_KEYS_FROM = "SELECT key FROM kv WHERE key >= ? ORDER BY key LIMIT ?"
+_SQL_SCAN_RANGE = "SELECT key, value FROM kv WHERE key >= ? AND key < ? ORDER BY key LIMIT ?"
+_SQL_SCAN_FROM = "SELECT key, value FROM kv WHERE key >= ? ORDER BY key LIMIT ?"
+# keys() pages through the index this many keys per query.
+_KEYS_PAGE_SIZE = 1024
+
+_SQL_PUT = (
+    "INSERT INTO kv(key, value) VALUES(?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+)
+_SQL_DELETE = "DELETE FROM kv WHERE key = ?"
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Smallest string greater than every string starting with `prefix`, or
+    None if there is none (prefix is all U+10FFFF).
+
+    Prefix filters are range scans `prefix <= key < bound` on the primary
+    key index. Unlike LIKE, this is case-sensitive and does not treat the
+    `_`/`%` in prefixes such as "DD_" as wildcards. SQLite compares TEXT
+    as UTF-8 bytes, which orders the same as code points.
+    """
+    p = prefix
+    while p:
+        c = ord(p[-1]) + 1
+        if c <= 0x10FFFF:
+            if 0xD800 <= c <= 0xDFFF:
+                c = 0xE000  # skip surrogates (not encodable as UTF-8)
+            return p[:-1] + chr(c)
+        p = p[:-1]
+    return None
+
+
 class _SQLiteBatch(WalletBatch):
     def __init__(self, store: "SQLiteWalletStorage") -> None:
         self._store = store
@@ -69,15 +155,18 @@ class SQLiteWalletStorage(WalletStorage):
     - Values are stored as JSON strings
     - begin_batch() starts a transaction and returns a WalletBatch
     - Non-batch operations are wrapped in their own transaction implicitly
+    - Opened in WAL mode with synchronous=NORMAL (see _PRAGMAS)
+    - check_same_thread=False is safe: every access holds self._lock
     """
 
     def __init__(self, db_path: Union[str, Path]) -> None:
         self._path = str(db_path)
         self._lock = RLock()
+        # Shared across threads; self._lock serializes all connection use.
         self._conn = sqlite3.connect(self._path, check_same_thread=False)
-        self._conn.execute(
-            "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
-        )
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self._conn.execute(_SQL_CREATE)
         self._conn.commit()
         self._in_tx = False
 
@@ -103,21 +192,16 @@ class SQLiteWalletStorage(WalletStorage):
 
     def _put_tx(self, key: str, value: Any) -> None:
         blob = _encode(value)
-        self._conn.execute(
-            "INSERT INTO kv(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            (key, blob),
-        )
+        self._conn.execute(_SQL_PUT, (key, blob))
 
     def _delete_tx(self, key: str) -> None:
-        self._conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+        self._conn.execute(_SQL_DELETE, (key,))
 
     # ---- WalletStorage interface ----
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            cur = self._conn.execute("SELECT value FROM kv WHERE key = ?", (key,))
-            row = cur.fetchone()
+            row = self._conn.execute(_SQL_GET, (key,)).fetchone()
             if row is None:
                 return None
             return _decode(row[0])
@@ -142,21 +226,74 @@ class SQLiteWalletStorage(WalletStorage):
                 self._conn.rollback()
                 raise
 
-    def exists(self, key: str) -> bool:
+    def put_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        # one transaction + executemany instead of BEGIN/commit per row
+        rows = [(k, _encode(v)) for k, v in items]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_SQL_PUT, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        rows = [(k,) for k in keys]
+        if not rows:
+            return
         with self._lock:
-            cur = self._conn.execute("SELECT 1 FROM kv WHERE key = ? LIMIT 1", (key,))
-            return cur.fetchone() is not None
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_SQL_DELETE, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
 
-    def keys(self, prefix: str = "") -> Iterable[str]:
+    def exists(self, key: str) -> bool:
         with self._lock:
-            if not prefix:
-                cur = self._conn.execute("SELECT key FROM kv")
-                return [r[0] for r in cur.fetchall()]
-            cur = self._conn.execute(
-                "SELECT key FROM kv WHERE key LIKE ?",
-                (f"{prefix}%",),
-            )
-            return [r[0] for r in cur.fetchall()]
+            return self._conn.execute(_SQL_EXISTS, (key,)).fetchone() is not None
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        # Generator, in key order. Each page is its own short query (keyset
+        # pagination) run under the lock; no cursor or lock is held while
+        # the caller consumes keys, so it may read/write the store meanwhile.
+        hi = _prefix_upper_bound(prefix) if prefix else None
+        lo = prefix
+        while True:
+            with self._lock:
+                if hi is None:
+                    rows = self._conn.execute(_SQL_KEYS_FROM, (lo, _KEYS_PAGE_SIZE)).fetchall()
+                else:
+                    rows = self._conn.execute(_SQL_KEYS_RANGE, (lo, hi, _KEYS_PAGE_SIZE)).fetchall()
+            for (k,) in rows:
+                yield k
+            if len(rows) < _KEYS_PAGE_SIZE:
+                return
+            # smallest string after the last key seen
+            lo = rows[-1][0] + "\x00"
+
+    def scan(self, prefix: str = "", batch_size: int = 512) -> Iterator[Tuple[str, Any]]:
+        # Generator, in key order: one range query per batch_size rows (keyset
+        # pagination, like keys()) instead of keys() + N point-gets. Rows are
+        # decoded and yielded outside the lock, one page in memory at a time.
+        page = max(1, batch_size)
+        hi = _prefix_upper_bound(prefix) if prefix else None
+        lo = prefix
+        while True:
+            with self._lock:
+                if hi is None:
+                    rows = self._conn.execute(_SQL_SCAN_FROM, (lo, page)).fetchall()
+                else:
+                    rows = self._conn.execute(_SQL_SCAN_RANGE, (lo, hi, page)).fetchall()
+            for k, v in rows:
+                yield k, _decode(v)
+            if len(rows) < page:
+                return
+            lo = rows[-1][0] + "\x00"
 
     def begin_batch(self) -> WalletBatch:
         with self._lock:
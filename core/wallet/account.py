@@ -14,10 +14,15 @@ Non-goals (later phases):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
 
 from core.wallet.bridge import address_from_node
-from core.wallet.keys.hd import HDNode as HDPrivNode, derive_bip44_account, derive_bip44_address
+from core.wallet.keys.hd import HDNode as HDPrivNode, derive_bip44_account, derive_bip44_chain
+
+
+# Per-account cap on memoized addresses (both chains together).
+_ADDRESS_CACHE_MAX = 4096
 
 
 @dataclass
@@ -36,6 +41,22 @@ class WalletAccount:
     receive_index: int = 0  # m/.../0/i
     change_index: int = 0   # m/.../1/i
 
+    # Derivation cache: the account node (three hardened steps) and its
+    # external/internal chain nodes are derived once, so each address costs
+    # a single non-hardened step. Keyed by (root, coin_type, account) and
+    # dropped if any of them is reassigned.
+    _account_node_cache: Optional[Tuple[Tuple[HDPrivNode, int, int], HDPrivNode]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _chain_node_cache: Dict[int, HDPrivNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (change, index) -> address, so rescans (new tx, another provider)
+    # are dict lookups. Bounded; dropped together with the node cache.
+    _address_cache: Dict[Tuple[int, int], str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         if self.gap_limit <= 0:
             raise ValueError("gap_limit must be > 0")
@@ -44,21 +65,68 @@ class WalletAccount:
 
     def _account_node(self) -> HDPrivNode:
         # m/44'/coin'/account'
-        return derive_bip44_account(self.root, self.coin_type, self.account)
+        key = (self.root, self.coin_type, self.account)
+        cached = self._account_node_cache
+        if cached is None or cached[0] != key:
+            cached = (key, derive_bip44_account(self.root, self.coin_type, self.account))
+            self._account_node_cache = cached
+            self._chain_node_cache = {}
+            self._address_cache = {}
+        return cached[1]
+
+    def _chain_node(self, change: int) -> HDPrivNode:
+        # m/44'/coin'/account'/change
+        account_node = self._account_node()  # validates the cache first
+        node = self._chain_node_cache.get(change)
+        if node is None:
+            node = derive_bip44_chain(account_node, change)
+            self._chain_node_cache[change] = node
+        return node
 
     def derive_receive_node(self, index: int) -> HDPrivNode:
         # m/44'/coin'/account'/0/index
-        return derive_bip44_address(self._account_node(), change=0, index=index)
+        return self._chain_node(0).derive_nonhardened(index)
 
     def derive_change_node(self, index: int) -> HDPrivNode:
         # m/44'/coin'/account'/1/index
-        return derive_bip44_address(self._account_node(), change=1, index=index)
+        return self._chain_node(1).derive_nonhardened(index)
+
+    def _address_at(self, change: int, index: int) -> str:
+        chain = self._chain_node(change)  # validates the caches first
+        key = (change, index)
+        cache = self._address_cache
+        addr = cache.get(key)
+        if addr is None:
+            addr = address_from_node(chain.derive_nonhardened(index))
+            if len(cache) >= _ADDRESS_CACHE_MAX:
+                del cache[next(iter(cache))]  # evict the oldest entry
+            cache[key] = addr
+        return addr
 
     def receive_address_at(self, index: int) -> str:
-        return address_from_node(self.derive_receive_node(index))
+        return self._address_at(0, index)
 
     def change_address_at(self, index: int) -> str:
-        return address_from_node(self.derive_change_node(index))
+        return self._address_at(1, index)
+
+    def iter_receive_addresses(self, start: int = 0, count: Optional[int] = None) -> Iterator[str]:
+        """Receive addresses from `start` in index order (endless if count is None)."""
+        return self._iter_addresses(0, start, count)
+
+    def iter_change_addresses(self, start: int = 0, count: Optional[int] = None) -> Iterator[str]:
+        """Change addresses from `start` in index order (endless if count is None)."""
+        return self._iter_addresses(1, start, count)
+
+    def _iter_addresses(self, change: int, start: int, count: Optional[int]) -> Iterator[str]:
+        if start < 0:
+            raise ValueError("start must be >= 0")
+        if count is not None and count < 0:
+            raise ValueError("count must be >= 0")
+        stop = None if count is None else start + count
+        i = start
+        while stop is None or i < stop:
+            yield self._address_at(change, i)
+            i += 1
 
     def next_receive_address(self) -> str:
         addr = self.receive_address_at(self.receive_index)
@@ -11,9 +11,15 @@ No P2SH / Bech32 / scripts yet.
 from __future__ import annotations
 
 import hashlib
+from typing import Callable, Optional
 
 from core.wallet.encoding.base58check import base58check_encode
 
+try:
+    from Crypto.Hash import RIPEMD160 as _PyCryptoRIPEMD160  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _PyCryptoRIPEMD160 = None
+
 
 class AddressError(ValueError):
     """Raised when an address cannot be created/validated."""
@@ -23,11 +29,40 @@ class AddressError(ValueError):
 DGB_P2PKH_VERSION = 0x1E  # 30
 
 
+def _resolve_ripemd160() -> Optional[Callable[[bytes], bytes]]:
+    """
+    Pick a native RIPEMD160 once, at import.
+
+    hashlib (OpenSSL) first; OpenSSL 3 builds without the legacy provider
+    lack ripemd160, so fall back to pycryptodome's C implementation.
+    """
+    try:
+        hashlib.new("ripemd160", b"")
+    except ValueError:
+        pass
+    else:
+        return lambda data: hashlib.new("ripemd160", data).digest()
+
+    if _PyCryptoRIPEMD160 is not None:
+        return lambda data: _PyCryptoRIPEMD160.new(data).digest()
+
+    return None
+
+
+_ripemd160 = _resolve_ripemd160()
+
+
 def hash160(data: bytes) -> bytes:
-    sha = hashlib.sha256(data).digest()
-    ripe = hashlib.new("ripemd160")
-    ripe.update(sha)
-    return ripe.digest()
+    """
+    HASH160 = RIPEMD160(SHA256(data))
+
+    The single implementation; key modules import it from here.
+    """
+    if _ripemd160 is None:
+        raise AddressError(
+            "ripemd160 not available on this platform (hashlib lacks it; install pycryptodome)."
+        )
+    return _ripemd160(hashlib.sha256(data).digest())
 
 
 def p2pkh_from_pubkey_hash(pubkey_hash20: bytes, version: int = DGB_P2PKH_VERSION) -> str:
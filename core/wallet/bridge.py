@@ -20,9 +20,8 @@ class BridgeError(ValueError):
 
 def _extract_privkey_bytes(node) -> bytes:
     """
-    Accept both node styles:
-    - node.private_key: bytes (new HDNode data object)
-    - node.private_key_hex: str (current BIP32 HDNode)
+    Both node styles (BIP32 HDNode and the HDNode data object) carry
+    node.private_key as raw bytes.
     """
     priv = getattr(node, "private_key", None)
     if isinstance(priv, (bytes, bytearray)):
@@ -30,16 +29,6 @@ def _extract_privkey_bytes(node) -> bytes:
             raise BridgeError("private_key must be 32 bytes")
         return bytes(priv)
 
-    priv_hex = getattr(node, "private_key_hex", None)
-    if isinstance(priv_hex, str) and priv_hex:
-        try:
-            b = bytes.fromhex(priv_hex)
-        except ValueError as e:
-            raise BridgeError("private_key_hex is not valid hex") from e
-        if len(b) != 32:
-            raise BridgeError("private_key_hex must decode to 32 bytes")
-        return b
-
     raise BridgeError("HDNode has no private key")
 
 
@@ -17,25 +17,30 @@ class Base58Error(ValueError):
     """Raised when Base58/Base58Check decoding fails."""
 
 
+# Every two-digit base58 string, indexed by its value (0..58*58-1).
+# Encoding peels off two digits per big-int divmod.
+_PAIRS = [(a + b).encode("ascii") for a in _ALPHABET for b in _ALPHABET]
+_PAIR_BASE = 58 * 58
+
+
 def b58encode(data: bytes) -> str:
     if not data:
         return ""
 
     n = int.from_bytes(data, "big")
-    out = ""
+    parts = []
     while n > 0:
-        n, rem = divmod(n, 58)
-        out = _ALPHABET[rem] + out
+        n, rem = divmod(n, _PAIR_BASE)
+        parts.append(_PAIRS[rem])
+    parts.reverse()
+    # The top pair may start with a zero digit ('1'); the number itself has
+    # no leading zeros, so strip them before adding the byte padding.
+    out = b"".join(parts).lstrip(b"1").decode("ascii")
 
     # Preserve leading 0x00 bytes as '1'
-    pad = 0
-    for b in data:
-        if b == 0:
-            pad += 1
-        else:
-            break
+    pad = len(data) - len(data.lstrip(b"\x00"))
 
-    return ("1" * pad) + (out or "")
+    return ("1" * pad) + out
 
 
 def b58decode(text: str) -> bytes:
@@ -29,9 +29,10 @@ from __future__ import annotations
 
 import hmac
 import hashlib
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
+from ..address import hash160  # re-exported for existing importers
 from ..errors import WalletError
 from .secp256k1 import pubkey_from_privkey, N as SECP256K1_N  # export below
 
@@ -150,19 +151,6 @@ def _parse256(b: bytes) -> int:
     return int.from_bytes(b, "big")
 
 
-def hash160(data: bytes) -> bytes:
-    """
-    HASH160 = RIPEMD160(SHA256(data))
-    """
-    sha = hashlib.sha256(data).digest()
-    try:
-        rip = hashlib.new("ripemd160")
-    except ValueError as e:
-        raise BIP32Error("ripemd160 not available in hashlib on this platform.") from e
-    rip.update(sha)
-    return rip.digest()
-
-
 def fingerprint_from_pubkey(pubkey_bytes: bytes) -> bytes:
     return hash160(pubkey_bytes)[:4]
 
@@ -218,10 +206,18 @@ def ckdpriv_hardened(parent_privkey_32: bytes, parent_chaincode_32: bytes, child
     return _ser256(ki), IR
 
 
-def ckdpriv_nonhardened(parent_privkey_32: bytes, parent_chaincode_32: bytes, child_number: int) -> Tuple[bytes, bytes]:
+def ckdpriv_nonhardened(
+    parent_privkey_32: bytes,
+    parent_chaincode_32: bytes,
+    child_number: int,
+    parent_pub: Optional[bytes] = None,
+) -> Tuple[bytes, bytes]:
     """
     Non-hardened CKDpriv, for i < 2^31:
       data = serP(Kpar) || ser32(i)
+
+    parent_pub: the parent's compressed pubkey, if the caller already has
+    it (saves one EC multiplication). Must match parent_privkey_32.
     """
     if child_number >= HARDENED_OFFSET:
         raise BIP32Error("Non-hardened child_number must be < 2^31.")
@@ -234,7 +230,8 @@ def ckdpriv_nonhardened(parent_privkey_32: bytes, parent_chaincode_32: bytes, ch
     if kpar <= 0 or kpar >= SECP256K1_N:
         raise BIP32Error("Invalid parent private key scalar.")
 
-    parent_pub = pubkey_from_privkey(parent_privkey_32, compressed=True)
+    if parent_pub is None:
+        parent_pub = pubkey_from_privkey(parent_privkey_32, compressed=True)
     data = parent_pub + _ser32(child_number)
 
     I = _hmac_sha512(parent_chaincode_32, data)
@@ -259,12 +256,19 @@ def ckdpriv_nonhardened(parent_privkey_32: bytes, parent_chaincode_32: bytes, ch
 class HDNode:
     """
     Private HD node (we can compute pubkeys from privkey using secp256k1.py).
+
+    Key material is kept as raw bytes so derivation passes it straight
+    through; the *_hex properties are read-only views for callers that
+    want hex.
     """
     depth: int
     child_number: int
-    private_key_hex: str
-    chain_code_hex: str
-    parent_fingerprint_hex: str = "00000000"  # root uses 00000000
+    private_key: bytes
+    chain_code: bytes
+    parent_fingerprint: bytes = b"\x00\x00\x00\x00"  # root uses 00000000
+
+    # Memoized pubkey_compressed() (one EC multiplication per node).
+    _pub_cache: Optional[bytes] = field(default=None, init=False, compare=False, repr=False)
 
     @classmethod
     def from_seed(cls, seed: bytes) -> "HDNode":
@@ -272,19 +276,37 @@ class HDNode:
         return cls(
             depth=0,
             child_number=0,
-            private_key_hex=priv.hex(),
-            chain_code_hex=cc.hex(),
-            parent_fingerprint_hex="00000000",
+            private_key=priv,
+            chain_code=cc,
+            parent_fingerprint=b"\x00\x00\x00\x00",
         )
 
+    # ---- hex views (API compatibility) ----
+
+    @property
+    def private_key_hex(self) -> str:
+        return self.private_key.hex()
+
+    @property
+    def chain_code_hex(self) -> str:
+        return self.chain_code.hex()
+
+    @property
+    def parent_fingerprint_hex(self) -> str:
+        return self.parent_fingerprint.hex()
+
     def _priv_bytes(self) -> bytes:
-        return bytes.fromhex(self.private_key_hex)
+        return self.private_key
 
     def _cc_bytes(self) -> bytes:
-        return bytes.fromhex(self.chain_code_hex)
+        return self.chain_code
 
     def pubkey_compressed(self) -> bytes:
-        return pubkey_from_privkey(self._priv_bytes(), compressed=True)
+        pub = self._pub_cache
+        if pub is None:
+            pub = pubkey_from_privkey(self.private_key, compressed=True)
+            object.__setattr__(self, "_pub_cache", pub)
+        return pub
 
     def fingerprint(self) -> bytes:
         return fingerprint_from_pubkey(self.pubkey_compressed())
@@ -296,13 +318,13 @@ class HDNode:
             raise BIP32Error("Hardened index must be 0..2^31-1.")
         child_number = index + HARDENED_OFFSET
 
-        child_priv, child_cc = ckdpriv_hardened(self._priv_bytes(), self._cc_bytes(), child_number)
+        child_priv, child_cc = ckdpriv_hardened(self.private_key, self.chain_code, child_number)
         return HDNode(
             depth=self.depth + 1,
             child_number=child_number,
-            private_key_hex=child_priv.hex(),
-            chain_code_hex=child_cc.hex(),
-            parent_fingerprint_hex=self.fingerprint().hex(),
+            private_key=child_priv,
+            chain_code=child_cc,
+            parent_fingerprint=self.fingerprint(),
         )
 
     def derive_nonhardened(self, index: int) -> "HDNode":
@@ -310,13 +332,17 @@ class HDNode:
             raise BIP32Error("Non-hardened index must be 0..2^31-1.")
         child_number = index
 
-        child_priv, child_cc = ckdpriv_nonhardened(self._priv_bytes(), self._cc_bytes(), child_number)
+        # serP(Kpar) for the HMAC and the child's parent fingerprint share
+        # one pubkey computation.
+        child_priv, child_cc = ckdpriv_nonhardened(
+            self.private_key, self.chain_code, child_number, parent_pub=self.pubkey_compressed()
+        )
         return HDNode(
             depth=self.depth + 1,
             child_number=child_number,
-            private_key_hex=child_priv.hex(),
-            chain_code_hex=child_cc.hex(),
-            parent_fingerprint_hex=self.fingerprint().hex(),
+            private_key=child_priv,
+            chain_code=child_cc,
+            parent_fingerprint=self.fingerprint(),
         )
 
     def derive_path(self, path: DerivationPath) -> "HDNode":
@@ -42,9 +42,8 @@ class SignedTransaction:
 
 def _extract_privkey_bytes(node) -> bytes:
     """
-    Accept both node styles:
-    - node.private_key: bytes
-    - node.private_key_hex: str
+    Both node styles (BIP32 HDNode and the HDNode data object) carry
+    node.private_key as raw bytes.
     """
     priv = getattr(node, "private_key", None)
     if isinstance(priv, (bytes, bytearray)):
@@ -53,16 +52,6 @@ def _extract_privkey_bytes(node) -> bytes:
             raise SigningError("private_key must be 32 bytes")
         return b
 
-    priv_hex = getattr(node, "private_key_hex", None)
-    if isinstance(priv_hex, str) and priv_hex:
-        try:
-            b = bytes.fromhex(priv_hex)
-        except ValueError as e:
-            raise SigningError("private_key_hex is not valid hex") from e
-        if len(b) != 32:
-            raise SigningError("private_key_hex must decode to 32 bytes")
-        return b
-
     raise SigningError("node has no private key (watch-only)")
 
 
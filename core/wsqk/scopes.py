@@ -15,7 +15,7 @@ License: MIT (see root LICENSE)
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from hashlib import sha256
 from typing import Any, Dict, Optional
 import json
@@ -40,6 +40,9 @@ class WSQKScope:
     not_before: int
     expires_at: int
 
+    # Memoized scope_hash() (the scope is immutable once built).
+    _cached_hash: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+
     def is_active(self, now: Optional[int] = None) -> bool:
         t = int(now if now is not None else time.time())
         return self.not_before <= t <= self.expires_at
@@ -72,9 +75,16 @@ class WSQKScope:
     def scope_hash(self) -> str:
         """
         Stable hash used for nonce binding / audit.
+
+        Computed once per instance and cached: the signing path hashes the
+        same scope to mint its capability and again to check it.
         """
-        encoded = json.dumps(self.to_dict(), sort_keys=True).encode()
-        return sha256(encoded).hexdigest()
+        h = self._cached_hash
+        if h is None:
+            encoded = json.dumps(self.to_dict(), sort_keys=True).encode()
+            h = sha256(encoded).hexdigest()
+            object.__setattr__(self, "_cached_hash", h)
+        return h
 
     @staticmethod
     def from_ttl(
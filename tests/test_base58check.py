@@ -2,6 +2,8 @@ import pytest
 
 from core.wallet.encoding.base58check import (
     Base58Error,
+    b58decode,
+    b58encode,
     base58check_decode,
     base58check_encode,
 )
@@ -24,3 +26,23 @@ def test_base58check_bad_checksum():
     bad = s[:-1] + ("1" if s[-1] != "1" else "2")
     with pytest.raises(Base58Error):
         base58check_decode(bad)
+
+
+def test_b58encode_matches_reference_digit_loop():
+    import os
+
+    alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+    def reference(data: bytes) -> str:
+        n = int.from_bytes(data, "big")
+        out = ""
+        while n > 0:
+            n, rem = divmod(n, 58)
+            out = alphabet[rem] + out
+        return "1" * (len(data) - len(data.lstrip(b"\x00"))) + out
+
+    cases = [b"\x00", b"\x00\x00", b"\x00\x01", b"\x39", b"\x3a", b"\xff" * 3, b"\x00" * 3 + b"\x0d\x24"]
+    cases += [os.urandom(n) for n in (1, 2, 20, 25, 33, 78) for _ in range(20)]
+    for data in cases:
+        assert b58encode(data) == reference(data)
+        assert b58decode(b58encode(data)) == data
@@ -27,3 +27,15 @@ def test_hdnode_from_seed_smoke():
     assert node.child_number == 0
     assert len(bytes.fromhex(node.private_key_hex)) == 32
     assert len(bytes.fromhex(node.chain_code_hex)) == 32
+
+
+def test_hdnode_stores_raw_bytes_with_hex_views():
+    node = HDNode.from_seed(bytes.fromhex("000102030405060708090a0b0c0d0e0f"))
+    child = node.derive_nonhardened(0)
+
+    assert isinstance(child.private_key, bytes) and len(child.private_key) == 32
+    assert isinstance(child.chain_code, bytes) and len(child.chain_code) == 32
+    assert child.parent_fingerprint == node.fingerprint()
+    assert child.private_key_hex == child.private_key.hex()
+    assert child.chain_code_hex == child.chain_code.hex()
+    assert child.parent_fingerprint_hex == child.parent_fingerprint.hex()
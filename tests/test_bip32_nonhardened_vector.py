@@ -19,3 +19,18 @@ def test_nonhardened_derivation_smoke_and_lengths():
     child1 = root.derive_nonhardened(1)
     assert child0.private_key_hex != child1.private_key_hex
     assert child0.chain_code_hex != child1.chain_code_hex
+
+
+def test_nonhardened_with_precomputed_parent_pub_matches_and_pub_is_memoized():
+    from core.wallet.keys.hd import ckdpriv_nonhardened
+    from core.wallet.keys.secp256k1 import pubkey_from_privkey
+
+    root = HDNode.from_seed(bytes.fromhex("000102030405060708090a0b0c0d0e0f"))
+    pub = root.pubkey_compressed()
+    assert root.pubkey_compressed() is pub
+    assert pub == pubkey_from_privkey(root.private_key, compressed=True)
+
+    assert ckdpriv_nonhardened(root.private_key, root.chain_code, 5) == ckdpriv_nonhardened(
+        root.private_key, root.chain_code, 5, parent_pub=pub
+    )
+    assert root == HDNode.from_seed(bytes.fromhex("000102030405060708090a0b0c0d0e0f"))
@@ -1,3 +1,5 @@
+from dataclasses import asdict
+
 import pytest
 
 from core.storage.memory_store import MemoryWalletStorage
@@ -168,8 +170,8 @@ def test_dd_store_apply_atomic_rolls_back_on_exception():
     with pytest.raises(RuntimeError):
         with storage.begin_batch() as b:
             # mirror what apply_atomic would do
-            b.put("DD_OUTPUT:txFAIL:0", out.__dict__)
-            b.put("DD_BALANCE:w1:a1:addr1", bal.__dict__)
+            b.put("DD_OUTPUT:txFAIL:0", asdict(out))
+            b.put("DD_BALANCE:w1:a1:addr1", asdict(bal))
             raise RuntimeError("boom")
 
     # state unchanged
@@ -177,3 +179,160 @@ def test_dd_store_apply_atomic_rolls_back_on_exception():
     got_bal = store.get_balance("w1", "a1", "addr1")
     assert got_bal is not None
     assert got_bal.balance_minor == 1
+
+
+def test_dd_store_cache_is_write_through_and_isolated_from_callers():
+    storage = MemoryWalletStorage()
+    store = DDStore(storage, cache_size=16)
+
+    bal = DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=10)
+    store.set_balance(bal)
+
+    got = store.get_balance("w1", "a1", "addr1")
+    assert got is not None
+    got.balance_minor = 999  # mutate without saving
+    assert store.get_balance("w1", "a1", "addr1").balance_minor == 10
+
+    store.set_balance(DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=20))
+    assert store.get_balance("w1", "a1", "addr1").balance_minor == 20
+
+    store.apply_atomic(
+        balances_upsert=[DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=30)]
+    )
+    assert store.get_balance("w1", "a1", "addr1").balance_minor == 30
+
+
+def test_dd_store_cache_is_bounded():
+    storage = MemoryWalletStorage()
+    store = DDStore(storage, cache_size=2)
+
+    for i in range(3):
+        store.save_output(
+            DDOutput(txid=f"tx{i}", vout=0, wallet_id="w1", account_id="a1", address="a", amount_minor=i)
+        )
+
+    assert len(store._out_cache._data) == 2
+    # evicted entry still loads from storage
+    got = store.load_output("tx0", 0)
+    assert got is not None
+    assert got.amount_minor == 0
+
+
+def test_dd_store_iter_decodes_records_missing_defaulted_fields():
+    storage = MemoryWalletStorage()
+    store = DDStore(storage)
+
+    # older record written before is_active existed
+    storage.put(
+        "DD_POSITION:legacy",
+        {
+            "position_id": "legacy",
+            "wallet_id": "w1",
+            "account_id": "a1",
+            "dgb_collateral": 1,
+            "dd_minted": 1,
+            "lock_tier": 0,
+            "unlock_height": 0,
+        },
+    )
+    store.save_position(
+        DDPosition(
+            position_id="new",
+            wallet_id="w1",
+            account_id="a1",
+            dgb_collateral=2,
+            dd_minted=2,
+            lock_tier=1,
+            unlock_height=10,
+            is_active=False,
+        )
+    )
+
+    by_id = {p.position_id: p for p in store.iter_positions()}
+    assert by_id["legacy"].is_active is True
+    assert by_id["new"].is_active is False
+    assert by_id["new"].unlock_height == 10
+
+
+def test_dd_store_default_sees_writes_from_other_instances():
+    storage = MemoryWalletStorage()
+    a = DDStore(storage)
+    b = DDStore(storage)
+
+    a.set_balance(DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=1))
+    assert b.get_balance("w1", "a1", "addr1").balance_minor == 1
+
+    b.set_balance(DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=2))
+    assert a.get_balance("w1", "a1", "addr1").balance_minor == 2
+
+    storage.delete(next(iter(storage.keys("DD_BALANCE:"))))
+    assert a.get_balance("w1", "a1", "addr1") is None
+
+
+def test_dd_store_cache_survives_concurrent_access():
+    import threading
+
+    storage = MemoryWalletStorage()
+    store = DDStore(storage, cache_size=8)
+    for i in range(32):
+        store.save_output(
+            DDOutput(txid=f"tx{i}", vout=0, wallet_id="w1", account_id="a1", address="a", amount_minor=i)
+        )
+
+    errors = []
+
+    def worker(offset: int) -> None:
+        try:
+            for n in range(2000):
+                i = (n + offset) % 32
+                assert store.load_output(f"tx{i}", 0).amount_minor == i
+        except Exception as exc:  # pragma: no cover - only on failure
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(store._out_cache._data) <= 8
+
+
+def test_dd_store_cache_fill_does_not_overwrite_a_concurrent_save():
+    storage = MemoryWalletStorage()
+    store = DDStore(storage, cache_size=8)
+    store.set_balance(DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=1))
+    store._bal_cache.pop(store._bal_key("w1", "a1", "addr1"))
+
+    real_get = storage.get
+
+    def racing_get(key):
+        raw = real_get(key)  # reader sees the old value...
+        storage.get = real_get
+        # ...then a writer saves before the reader fills the cache
+        store.set_balance(DDBalance(wallet_id="w1", account_id="a1", address="addr1", balance_minor=2))
+        return raw
+
+    storage.get = racing_get
+    assert store.get_balance("w1", "a1", "addr1").balance_minor == 1
+    assert store.get_balance("w1", "a1", "addr1").balance_minor == 2
+
+
+def test_dd_store_load_and_iter_decode_odd_rows_alike():
+    storage = MemoryWalletStorage()
+    store = DDStore(storage)
+    raw = asdict(DDOutput(txid="tx", vout=0, wallet_id="w1", account_id="a1", address="a", amount_minor=1))
+
+    # missing a defaulted field: both paths fill the default
+    legacy = {k: v for k, v in raw.items() if k != "is_spent"}
+    storage.put(store._out_key("tx", 0), legacy)
+    assert store.load_output("tx", 0).is_spent is False
+    assert [o.is_spent for o in store.iter_outputs()] == [False]
+
+    # unknown key: both paths reject the row
+    storage.put(store._out_key("tx", 0), {**raw, "unexpected": 1})
+    with pytest.raises(TypeError):
+        store.load_output("tx", 0)
+    with pytest.raises(TypeError):
+        list(store.iter_outputs())
@@ -13,3 +13,14 @@ def test_dgb_p2pkh_hash_length_validation():
         p2pkh_from_pubkey_hash(b"\x00" * 19)
     with pytest.raises(AddressError):
         p2pkh_from_pubkey_hash(b"\x00" * 21)
+
+
+def test_hash160_known_vector_and_missing_backend(monkeypatch):
+    import core.wallet.address as address
+
+    # HASH160("") = RIPEMD160(SHA256(""))
+    assert address.hash160(b"").hex() == "b472a266d0bd89c13706a4132ccfb16f7c3b9fcb"
+
+    monkeypatch.setattr(address, "_ripemd160", None)
+    with pytest.raises(AddressError):
+        address.hash160(b"")
@@ -1,3 +1,7 @@
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
 from core.eqc.context import (
     EQCContext,
     ActionContext,
@@ -6,6 +10,7 @@ from core.eqc.context import (
     UserContext,
 )
 from core.eqc.engine import EQCEngine
+from core.eqc.policies.registry import PolicyPackRegistry
 from core.eqc.verdicts import VerdictType
 
 
@@ -71,3 +76,362 @@ def test_context_hash_is_stable_for_same_context():
     h1 = ctx.context_hash()
     h2 = ctx.context_hash()
     assert h1 == h2
+
+
+def test_context_hash_distinguishes_field_values_and_extra():
+    base = _base_ctx()
+    assert base.context_hash() == _base_ctx().context_hash()
+    assert base.context_hash() != _base_ctx(amount=1001).context_hash()
+    assert base.context_hash() != _base_ctx(recipient=None).context_hash()
+
+    a = EQCContext(
+        action=base.action, device=base.device, network=base.network, user=base.user,
+        timestamp=base.timestamp, extra={"k": "1"},
+    )
+    b = EQCContext(
+        action=base.action, device=base.device, network=base.network, user=base.user,
+        timestamp=base.timestamp, extra={"k": 1},
+    )
+    assert a.context_hash() != b.context_hash()
+
+
+def test_context_hash_is_memoized_and_not_part_of_equality():
+    ctx = _base_ctx()
+    assert ctx._cached_hash is None
+    h = ctx.context_hash()
+    assert ctx._cached_hash == h
+    assert ctx.context_hash() is h
+
+    fresh = replace(ctx)
+    assert fresh._cached_hash is None
+    assert fresh == ctx
+
+
+def test_default_classes_resolve_lazily_and_once():
+    from core.eqc import engine as eng
+    from core.eqc.policy import EQCPolicy
+    from core.eqc.classifiers.tx_classifier import TransactionClassifier
+
+    assert eng._resolve_class(*eng._POLICY_SPEC) is EQCPolicy
+    assert eng._resolve_class(*eng._TX_CLASSIFIER_SPEC) is TransactionClassifier
+
+    assert eng._PolicyClass is EQCPolicy
+    assert eng._TxClassifierClass is TransactionClassifier
+    assert "_TxClassifierClass" in vars(eng)
+
+    engine = EQCEngine()
+    assert isinstance(engine._policy, EQCPolicy)
+    assert isinstance(engine._tx, TransactionClassifier)
+
+
+def test_decide_without_packs_returns_base_verdict_unmerged():
+    engine = EQCEngine(enabled_policy_packs=[])
+    decision = engine.decide(_base_ctx())
+    assert decision.verdict.type == VerdictType.ALLOW
+    assert decision.signals["policy_packs"] == []
+    assert len(decision.verdict.reasons) >= 1
+
+
+def test_decide_skips_registry_when_no_packs_enabled(monkeypatch):
+    def _fail(**kwargs):
+        raise AssertionError("registry must not be consulted")
+
+    registry = PolicyPackRegistry()
+    monkeypatch.setattr(registry, "evaluate", _fail)
+    engine = EQCEngine(policy_registry=registry, enabled_policy_packs=[])
+    assert engine.decide(_base_ctx()).verdict.type == VerdictType.ALLOW
+
+
+def test_merge_verdicts_keeps_all_reasons_of_winning_type():
+    from core.eqc.engine import _merge_verdicts
+    from core.eqc.verdicts import Reason, ReasonCode, StepUp, Verdict
+
+    def r(msg):
+        return Reason(code=ReasonCode.POLICY_RULE_MATCH, message=msg)
+
+    step = StepUp(requirements=["pin"])
+    merged = _merge_verdicts(
+        Verdict.allow(r("a")),
+        [
+            Verdict(type=VerdictType.STEP_UP, reasons=[r("s1")]),
+            Verdict.deny(r("d1")),
+            Verdict.step_up(step, r("s2")),
+            Verdict.deny(r("d2")),
+        ],
+    )
+    assert merged.type == VerdictType.DENY
+    assert [x.message for x in merged.reasons] == ["d1", "d2"]
+
+    merged = _merge_verdicts(
+        Verdict.allow(r("a")),
+        [Verdict(type=VerdictType.STEP_UP, reasons=[r("s1")]), Verdict.step_up(step, r("s2"))],
+    )
+    assert merged.type == VerdictType.STEP_UP
+    assert [x.message for x in merged.reasons] == ["s1", "s2"]
+    assert merged.step_up is step
+
+
+def test_context_to_json_matches_to_dict_with_and_without_orjson(monkeypatch):
+    import json
+
+    from core.eqc import context as ctx_mod
+
+    ctx = _base_ctx(recipient="DGB1-ünïcode")
+    text = ctx.to_json()
+    assert json.loads(text) == ctx.to_dict()
+
+    monkeypatch.setattr(ctx_mod, "orjson", None)
+    assert json.loads(ctx.to_json()) == ctx.to_dict()
+
+
+def test_context_to_json_handles_values_orjson_rejects():
+    import json
+
+    base = _base_ctx()
+    ctx = replace(base, action=replace(base.action, amount=2**70), extra={"n": -(2**80)})
+    assert json.loads(ctx.to_json()) == ctx.to_dict()
+
+
+def test_context_to_json_keeps_non_finite_floats():
+    import json
+    import math
+
+    base = _base_ctx()
+    ctx = replace(
+        base,
+        network=replace(base.network, entropy_score=float("nan")),
+        extra={"limits": [float("inf"), None]},
+    )
+    parsed = json.loads(ctx.to_json())
+    assert math.isnan(parsed["network"]["entropy_score"])
+    assert parsed["extra"] == {"limits": [float("inf"), None]}
+
+
+def test_context_extra_is_a_sorted_read_only_copy():
+    src = {"b": 2, "a": 1}
+    base = _base_ctx()
+    ctx = EQCContext(
+        action=base.action, device=base.device, network=base.network, user=base.user,
+        timestamp=base.timestamp, extra=src,
+    )
+    h = ctx.context_hash()
+
+    src["c"] = 3
+    assert list(ctx.extra) == ["a", "b"]
+    with pytest.raises(TypeError):
+        ctx.extra["c"] = 3  # type: ignore[index]
+
+    fresh = replace(ctx)
+    assert fresh.context_hash() == h
+    assert ctx.to_dict()["extra"] == {"a": 1, "b": 2}
+
+
+def test_enable_disable_policy_packs_keeps_order_and_dedupes():
+    engine = EQCEngine(enabled_policy_packs=["a", "b", "a"])
+    engine.enable_policy_pack("c")
+    engine.enable_policy_pack("b")
+    assert list(engine._enabled_policy_packs) == ["a", "b", "c"]
+
+    engine.disable_policy_pack("b")
+    engine.disable_policy_pack("missing")
+    assert list(engine._enabled_policy_packs) == ["a", "c"]
+
+
+def test_canonical_bytes_are_cached_and_back_the_hash():
+    import hashlib
+
+    ctx = _base_ctx()
+    blob = ctx.canonical_bytes()
+    assert ctx.canonical_bytes() is blob
+    assert ctx.context_hash() == hashlib.sha256(blob).hexdigest()
+
+
+def test_policy_evaluate_adapter_matches_signature_once():
+    from core.eqc.engine import _policy_evaluate_adapter
+
+    class KwPolicy:
+        def evaluate(self, ctx, *, device_signals, tx_signals):
+            return ("kw", device_signals, tx_signals)
+
+    class PosPolicy:
+        def evaluate(self, ctx, d, t):
+            return ("pos", d, t)
+
+    class CtxPolicy:
+        def evaluate(self, ctx):
+            return ("ctx",)
+
+    class RaisingPolicy:
+        def evaluate(self, ctx, device_signals=None, tx_signals=None):
+            raise TypeError("bug inside policy")
+
+    assert _policy_evaluate_adapter(KwPolicy())("c", 1, 2) == ("kw", 1, 2)
+    assert _policy_evaluate_adapter(PosPolicy())("c", 1, 2) == ("pos", 1, 2)
+    assert _policy_evaluate_adapter(CtxPolicy())("c", 1, 2) == ("ctx",)
+
+    class VarPosPolicy:
+        def evaluate(self, ctx, *signals):
+            return ("var", signals)
+
+    assert _policy_evaluate_adapter(VarPosPolicy())("c", 1, 2) == ("var", (1, 2))
+
+    # A TypeError raised by the policy itself is no longer swallowed and retried.
+
+    with pytest.raises(TypeError, match="bug inside policy"):
+        _policy_evaluate_adapter(RaisingPolicy())("c", 1, 2)
+
+
+def test_decision_is_frozen_and_slotted():
+    decision = EQCEngine().decide(_base_ctx())
+    assert not hasattr(decision, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        decision.verdict = None  # type: ignore[misc]
+
+
+def test_packs_are_skipped_after_base_deny_unless_auditing():
+    from core.eqc.verdicts import Reason, ReasonCode, Verdict
+
+    class DenyPolicy:
+        def evaluate(self, ctx):
+            return Verdict.deny(Reason(code=ReasonCode.POLICY_DISALLOWS_ACTION, message="base"))
+
+    calls = []
+
+    class DenyPack:
+        def evaluate(self, ctx, *, device_signals, tx_signals):
+            calls.append(ctx)
+            return Verdict.deny(Reason(code=ReasonCode.POLICY_RULE_MATCH, message="pack"))
+
+    registry = PolicyPackRegistry()
+    registry.register_pack("deny_pack", DenyPack())
+
+    fast = EQCEngine(policy=DenyPolicy(), policy_registry=registry, enabled_policy_packs=["deny_pack"])
+    decision = fast.decide(_base_ctx())
+    assert decision.verdict.type == VerdictType.DENY
+    assert [r.message for r in decision.verdict.reasons] == ["base"]
+    assert decision.signals["policy_packs"] == []
+    assert calls == []
+
+    audit = EQCEngine(
+        policy=DenyPolicy(),
+        policy_registry=registry,
+        enabled_policy_packs=["deny_pack"],
+        audit_denied_packs=True,
+    )
+    decision = audit.decide(_base_ctx())
+    assert decision.verdict.type == VerdictType.DENY
+    assert [r.message for r in decision.verdict.reasons] == ["base", "pack"]
+    assert len(calls) == 1
+
+
+def test_context_normalized_fields_are_derived_and_not_compared():
+    ctx = _base_ctx(action="Mint", asset="DigiDollar", device_type="Browser")
+    assert (ctx.norm_device_type, ctx.norm_action, ctx.norm_asset) == ("browser", "mint", "digidollar")
+
+    moved = replace(ctx, device=replace(ctx.device, device_type="HARDWARE"))
+    assert moved.norm_device_type == "hardware"
+    assert "norm_action" not in repr(ctx)
+
+
+def test_strict_policy_signature_calls_evaluate_directly():
+    from core.eqc.verdicts import Reason, ReasonCode, Verdict
+
+    class PositionalPolicy:
+        def evaluate(self, ctx, device_signals, tx_signals):
+            return Verdict.allow(Reason(code=ReasonCode.POLICY_RULE_MATCH, message="strict"))
+
+    policy = PositionalPolicy()
+    engine = EQCEngine(policy=policy, enabled_policy_packs=[], strict_policy_signature=True)
+    assert engine._policy_evaluate == policy.evaluate
+    assert [r.message for r in engine.decide(_base_ctx()).verdict.reasons] == ["strict"]
+
+
+def test_policy_packs_env_is_reread_and_split_once_per_value(monkeypatch):
+    from core.eqc.engine import _parse_policy_packs_env, _split_policy_packs
+
+    monkeypatch.setenv("EQC_POLICY_PACKS", " a:A , ,b:B ")
+    assert _parse_policy_packs_env() == ("a:A", "b:B")
+    assert _parse_policy_packs_env() is _parse_policy_packs_env()
+    assert _split_policy_packs.cache_info().currsize >= 1
+
+    monkeypatch.setenv("EQC_POLICY_PACKS", "c:C")
+    assert list(EQCEngine()._enabled_policy_packs) == ["c:C"]
+    monkeypatch.delenv("EQC_POLICY_PACKS")
+    assert _parse_policy_packs_env() == ()
+
+
+def test_decide_batch_matches_decide_in_order():
+    engine = EQCEngine(enabled_policy_packs=[])
+    ctxs = [_base_ctx(), _base_ctx(device_type="browser"), _base_ctx(action="mint", asset="DigiDollar")]
+    batch = engine.decide_batch(ctxs)
+    assert [d.verdict.type for d in batch] == [engine.decide(c).verdict.type for c in ctxs]
+    assert [d.context_hash for d in batch] == [c.context_hash() for c in ctxs]
+
+
+def test_shared_hostile_runtime_verdict_cannot_be_mutated():
+    engine = EQCEngine()
+    verdict = engine.decide(_base_ctx(device_type="browser")).verdict
+
+    with pytest.raises(AttributeError):
+        verdict.reasons.append(None)  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        verdict.reasons[0].details["device_type"] = "mobile"  # type: ignore[index]
+
+    again = engine.decide(_base_ctx(device_type="browser")).verdict
+    assert again.to_dict()["reasons"][0]["details"] == {"device_type": "browser"}
+
+
+def test_shared_dd_step_up_verdict_cannot_be_mutated():
+    engine = EQCEngine()
+    verdict = engine.decide(_base_ctx(action="mint", asset="DigiDollar")).verdict
+
+    assert verdict.step_up.requirements == ("confirm_user_intent",)
+    with pytest.raises(AttributeError):
+        verdict.step_up.requirements.append("pin")  # type: ignore[attr-defined]
+    with pytest.raises(FrozenInstanceError):
+        verdict.step_up.requirements = ["pin"]  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        verdict.reasons[0].details["action"] = "send"  # type: ignore[index]
+
+
+def test_context_extra_is_frozen_at_every_level():
+    from hashlib import sha256
+
+    from core.eqc.context import _canonical
+
+    nested = {"tags": ["a", "b"], "meta": {"z": 1, "y": [2]}}
+    base = _base_ctx()
+    ctx = EQCContext(
+        action=base.action, device=base.device, network=base.network, user=base.user,
+        timestamp=base.timestamp, extra={"nested": nested},
+    )
+    h = ctx.context_hash()
+
+    nested["tags"].append("c")
+    nested["meta"]["y"].append(3)
+    nested["meta"]["x"] = 0
+    assert sha256(_canonical(ctx)).hexdigest() == h
+
+    with pytest.raises(TypeError):
+        ctx.extra["nested"]["meta"]["x"] = 0  # type: ignore[index]
+    assert ctx.extra["nested"]["tags"] == ("a", "b")
+    assert ctx.to_dict()["extra"] == {"nested": {"tags": ["a", "b"], "meta": {"y": [2], "z": 1}}}
+
+
+def test_context_extra_non_str_keys_hash_as_json_text():
+    base = _base_ctx()
+
+    def with_extra(extra):
+        return EQCContext(
+            action=base.action, device=base.device, network=base.network, user=base.user,
+            timestamp=base.timestamp, extra=extra,
+        )
+
+    int_keys = with_extra({"m": {2: "b", 10: "a"}, 1: True})
+    str_keys = with_extra({"m": {"2": "b", "10": "a"}, "1": True})
+    assert int_keys.context_hash() == str_keys.context_hash()
+    assert int_keys.extra[1] is True
+
+    with_extra({1: "a", "b": 2, None: 3}).context_hash()  # mixed key types are fine
+    with pytest.raises(TypeError):
+        with_extra({(1, 2): "tuple key"})
@@ -41,3 +41,11 @@ def test_invariant_extension_is_denied_with_reason():
     decision = engine.decide(_ctx("extension"))
     assert decision.verdict.type == VerdictType.DENY
     assert _has_reason(decision.verdict, ReasonCode.EXTENSION_CONTEXT_BLOCKED)
+
+
+def test_invariant_verdicts_are_shared_constants():
+    engine = EQCEngine()
+    d1 = engine.decide(_ctx("browser"))
+    d2 = engine.decide(_ctx("Browser"))
+    assert d1.verdict is d2.verdict
+    assert d1.signals == {"invariant": "HOSTILE_RUNTIME", "device_type": "browser"}
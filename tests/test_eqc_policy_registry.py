@@ -0,0 +1,144 @@
+import pytest
+
+from core.eqc.policies.registry import PolicyPackRegistry
+from core.eqc.verdicts import Verdict, VerdictType
+
+
+class _ObjPack:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def evaluate(self, context, *, device_signals=None, tx_signals=None):
+        self.calls += 1
+        return Verdict(type=VerdictType.STEP_UP)
+
+
+def _callable_pack(context, *, device_signals=None, tx_signals=None):
+    return Verdict.allow()
+
+
+def _silent_pack(context, *, device_signals=None, tx_signals=None):
+    return None
+
+
+def test_batch_evaluate_runs_enabled_packs_in_order():
+    reg = PolicyPackRegistry()
+    obj = _ObjPack()
+    reg.register_pack("obj", obj)
+    reg.register_pack("fn", _callable_pack)
+    reg.register_pack("silent", _silent_pack)
+
+    out = reg.batch_evaluate(
+        object(), enabled=["fn", " obj ", "", "silent"], device_signals=None, tx_signals=None
+    )
+    assert [v.type for v in out] == [VerdictType.ALLOW, VerdictType.STEP_UP]
+    assert obj.calls == 1
+
+
+def test_evaluate_delegates_to_batch_and_lazy_loads_refs():
+    reg = PolicyPackRegistry()
+    ref = "core.eqc.policies.packs.high_value_step_up:HighValueStepUpPack"
+
+    from core.eqc.context import ActionContext, DeviceContext, EQCContext, NetworkContext, UserContext
+
+    ctx = EQCContext(
+        action=ActionContext(action="send", asset="DGB", amount=50_000),
+        device=DeviceContext(),
+        network=NetworkContext(),
+        user=UserContext(),
+        timestamp=1,
+    )
+    out = reg.evaluate(ctx, enabled=[ref], device_signals=None, tx_signals=None)
+    assert [v.type for v in out] == [VerdictType.STEP_UP]
+    assert ref in reg._dispatch
+
+
+def test_high_value_pack_shares_allow_on_no_match():
+    from core.eqc.context import ActionContext, DeviceContext, EQCContext, NetworkContext, UserContext
+    from core.eqc.policies.packs import HighValueStepUpPack
+
+    def _ctx(action, amount):
+        return EQCContext(
+            action=ActionContext(action=action, asset="DGB", amount=amount),
+            device=DeviceContext(),
+            network=NetworkContext(),
+            user=UserContext(),
+            timestamp=1,
+        )
+
+    pack = HighValueStepUpPack(threshold=100)
+    low = pack.evaluate(_ctx("send", 5))
+    other = pack.evaluate(_ctx("vote", 500))
+    assert low.type == VerdictType.ALLOW and low is other
+    assert pack.evaluate(_ctx("SEND", 500)).type == VerdictType.STEP_UP
+
+
+def test_pack_ref_resolution_is_cached_but_instances_are_not():
+    from core.eqc.policies.registry import _resolve_pack_ref, _resolve_pack_target
+
+    ref = "core.eqc.policies.packs.high_value_step_up:HighValueStepUpPack"
+    _resolve_pack_target.cache_clear()
+    first = _resolve_pack_ref(ref)
+    second = _resolve_pack_ref(f"  {ref} ")
+    assert type(first) is type(second) and first is not second
+    assert _resolve_pack_target.cache_info().hits == 1
+
+
+def test_policy_pack_evaluate_returns_rule_verdicts_as_list():
+    from core.eqc.policies.types import PolicyPack
+
+    class _Rule:
+        name = "r"
+
+        def __init__(self, vtype):
+            self.vtype = vtype
+
+        def evaluate(self, context):
+            return Verdict(type=self.vtype)
+
+    pack = PolicyPack(name="p", rules=(_Rule(VerdictType.ALLOW), _Rule(VerdictType.DENY)))
+    out = pack.evaluate(object())
+    assert isinstance(out, list)
+    assert [v.type for v in out] == [VerdictType.ALLOW, VerdictType.DENY]
+    assert pack.evaluate_batch([object(), object()]) == [out, out]
+
+
+def test_high_value_pack_reuses_step_up_per_threshold():
+    from core.eqc.context import ActionContext, DeviceContext, EQCContext, NetworkContext, UserContext
+    from core.eqc.policies.packs import HighValueStepUpPack
+
+    ctx = EQCContext(
+        action=ActionContext(action="send", asset="DGB", amount=1_000),
+        device=DeviceContext(),
+        network=NetworkContext(),
+        user=UserContext(),
+        timestamp=1,
+    )
+    pack = HighValueStepUpPack(threshold=100)
+    first = pack.evaluate(ctx).step_up
+    assert pack.evaluate(ctx).step_up is first
+    assert first.requirements == ("confirm_user_intent",)
+    with pytest.raises(AttributeError):
+        first.requirements.append("pin")  # type: ignore[attr-defined]
+
+    pack.threshold = 500
+    assert "500" in pack.evaluate(ctx).step_up.message
+
+
+def test_high_value_pack_shared_allow_cannot_be_mutated():
+    from core.eqc.context import ActionContext, DeviceContext, EQCContext, NetworkContext, UserContext
+    from core.eqc.policies.packs import HighValueStepUpPack
+
+    ctx = EQCContext(
+        action=ActionContext(action="send", asset="DGB", amount=1),
+        device=DeviceContext(),
+        network=NetworkContext(),
+        user=UserContext(),
+        timestamp=1,
+    )
+    pack = HighValueStepUpPack(threshold=100)
+    allow = pack.evaluate(ctx)
+    assert allow.type == VerdictType.ALLOW
+    with pytest.raises(AttributeError):
+        allow.reasons.append(None)  # type: ignore[attr-defined]
+    assert pack.evaluate(ctx).reasons == ()
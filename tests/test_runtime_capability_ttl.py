@@ -20,3 +20,17 @@ def test_capability_with_ttl_expires():
     assert cap.is_expired(now=1002) is True
     with pytest.raises(ValueError):
         cap.assert_valid(now=1002)
+
+
+def test_batch_issued_capabilities_match_single_issue_shape():
+    from core.runtime.capabilities import issue_runtime_capabilities
+
+    caps = issue_runtime_capabilities(scope_hashes=["s1", "s2", "s3"], ttl_seconds=5, issued_at=1000)
+    single = issue_runtime_capability(scope_hash="s0", issued_at=1000)
+
+    assert [c.scope_hash for c in caps] == ["s1", "s2", "s3"]
+    assert {c.issued_at for c in caps} == {1000}
+    assert len({c.token for c in caps}) == 3
+    assert all(len(c.token) == len(single.token) for c in caps)
+    caps[0].assert_valid(now=1005)
+    assert issue_runtime_capabilities(scope_hashes=[]) == []
@@ -67,3 +67,37 @@ def test_shield_gate_allows_execution_when_shield_allows():
 
     assert out == {"ok": True}
     assert called["n"] == 1
+
+
+def test_shield_decision_without_blocked_fails_closed():
+    class MalformedShield:
+        def evaluate(self, intent: SigningIntent):
+            return object()
+
+    called = {"n": 0}
+
+    def executor(_ctx):
+        called["n"] += 1
+
+    intent = SigningIntent(wallet_id="wallet-1", account_id="account-1", action="sign")
+    with pytest.raises(ExecutionBlocked):
+        execute_signing_intent(intent=intent, executor=executor, shield=MalformedShield(), use_wsqk=False)
+    assert called["n"] == 0
+
+
+def test_shield_block_without_reason_still_fails_closed():
+    class ReasonlessBlock:
+        def evaluate(self, intent: SigningIntent):
+            class _D:
+                blocked = True
+            return _D()
+
+    called = {"n": 0}
+
+    def executor(_ctx):
+        called["n"] += 1
+
+    intent = SigningIntent(wallet_id="wallet-1", account_id="account-1", action="sign")
+    with pytest.raises(ExecutionBlocked, match="malformed"):
+        execute_signing_intent(intent=intent, executor=executor, shield=ReasonlessBlock(), use_wsqk=False)
+    assert called["n"] == 0
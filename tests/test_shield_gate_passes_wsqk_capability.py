@@ -18,3 +18,40 @@ def test_shield_gate_executes_when_eqc_allows_and_shield_allows():
     out = execute_signing_intent(intent=intent, executor=executor, use_wsqk=False)
     assert out == {"ok": True}
     assert called["n"] == 1
+
+
+def test_eqc_context_shares_plain_sub_contexts_but_honors_extra():
+    from core.eqc.context import DeviceContext, NetworkContext, UserContext
+    from core.runtime.shield_signing_gate import _build_eqc_context
+
+    a = _build_eqc_context(SigningIntent(wallet_id="w", account_id="a", user_id="u1"))
+    b = _build_eqc_context(SigningIntent(wallet_id="w", account_id="b", user_id="u1"))
+    assert a.device is b.device and a.network is b.network and a.user is b.user
+    assert a.device == DeviceContext(device_id="device", device_type="mobile", os="ios")
+    assert a.network == NetworkContext(network="unknown")
+    assert a.user == UserContext(user_id="u1")
+
+    c = _build_eqc_context(
+        SigningIntent(
+            wallet_id="w",
+            account_id="a",
+            extra={"device_trusted": True, "peer_count": 8, "pin_set": True},
+        )
+    )
+    assert c.device.trusted is True
+    assert c.network.peer_count == 8
+    assert c.user.pin_set is True
+
+
+def test_default_engine_and_shield_are_reused_per_policy_pack_config(monkeypatch):
+    from core.runtime import shield_signing_gate as gate
+
+    monkeypatch.delenv("EQC_POLICY_PACKS", raising=False)
+    assert gate._default_eqc() is gate._default_eqc()
+    assert gate._default_shield() is gate._default_shield()
+
+    before = gate._default_eqc()
+    monkeypatch.setenv("EQC_POLICY_PACKS", "core.eqc.policies.packs.high_value_step_up:HighValueStepUpPack")
+    after = gate._default_eqc()
+    assert after is not before
+    assert list(after._enabled_policy_packs) == ["core.eqc.policies.packs.high_value_step_up:HighValueStepUpPack"]
@@ -1,3 +1,5 @@
+import pytest
+
 from core.runtime.shield_signing_gate import SigningIntent
 
 
@@ -20,3 +22,48 @@ def test_intent_hash_changes_when_intent_changes():
     )
 
     assert a.intent_hash() != b.intent_hash()
+
+
+def test_intent_hash_is_memoized_and_extra_is_a_read_only_copy():
+    extra = {"device_id": "d-1"}
+    intent = SigningIntent(wallet_id="wallet-1", account_id="account-1", extra=extra)
+    h = intent.intent_hash()
+
+    extra["device_id"] = "d-2"
+    assert intent.extra["device_id"] == "d-1"
+    assert intent.intent_hash() == h
+    assert intent == SigningIntent(wallet_id="wallet-1", account_id="account-1", extra={"device_id": "d-1"})
+    with pytest.raises(TypeError):
+        intent.extra["x"] = 1  # type: ignore[index]
+
+
+def test_intent_hash_is_positional_and_covers_extra():
+    base = SigningIntent(wallet_id="a", account_id="b")
+    assert base.intent_hash() != SigningIntent(wallet_id="b", account_id="a").intent_hash()
+    assert base.intent_hash() != SigningIntent(wallet_id="a", account_id="b", extra={"k": 1}).intent_hash()
+    assert (
+        SigningIntent(wallet_id="a", account_id="b", extra={"x": 1, "y": 2}).intent_hash()
+        == SigningIntent(wallet_id="a", account_id="b", extra={"y": 2, "x": 1}).intent_hash()
+    )
+
+
+def test_norm_action_is_derived_and_outside_hash_and_equality():
+    upper = SigningIntent(wallet_id="a", account_id="b", action="SEND")
+    lower = SigningIntent(wallet_id="a", account_id="b", action="send")
+
+    assert upper.norm_action == lower.norm_action == "send"
+    assert upper != lower
+    assert upper.intent_hash() != lower.intent_hash()
+
+
+def test_intent_extra_is_frozen_at_every_level():
+    nested = {"labels": ["a"], "meta": {"k": 1}}
+    intent = SigningIntent(wallet_id="a", account_id="b", extra={"nested": nested})
+    h = intent.intent_hash()
+
+    nested["labels"].append("b")
+    nested["meta"]["k"] = 2
+    fresh = SigningIntent(wallet_id="a", account_id="b", extra={"nested": {"labels": ["a"], "meta": {"k": 1}}})
+    assert intent.intent_hash() == h == fresh.intent_hash()
+    with pytest.raises(TypeError):
+        intent.extra["nested"]["meta"]["k"] = 3  # type: ignore[index]
@@ -70,3 +70,151 @@ def test_sqlite_keys_prefix(tmp_path: Path):
     assert {"DD_A", "DD_B", "EQC_X"} <= all_keys
 
     store.close()
+
+
+def test_sqlite_scan_prefix_small_batches(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    for i in range(5):
+        store.put(f"DD_{i}", {"i": i})
+    store.put("EQC_X", 3)
+
+    pairs = dict(store.scan(prefix="DD_", batch_size=2))
+    assert pairs == {f"DD_{i}": {"i": i} for i in range(5)}
+
+    store.close()
+
+
+def test_sqlite_scan_pages_in_key_order_and_allows_writes(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    for i in (3, 0, 4, 1, 2):
+        store.put(f"K_{i}", i)
+
+    queries = []
+    store._conn.set_trace_callback(queries.append)
+
+    seen = []
+    for k, v in store.scan(prefix="K_", batch_size=2):
+        seen.append((k, v))
+        # lock is not held between pages, so writes are allowed mid-scan
+        store.put("DONE_" + k, True)
+
+    store._conn.set_trace_callback(None)
+    assert seen == [(f"K_{i}", i) for i in range(5)]
+    scans = [q for q in queries if q.startswith("SELECT key, value")]
+    assert len(scans) == 3  # 5 rows in pages of 2
+    assert set(store.keys(prefix="DONE_")) == {f"DONE_K_{i}" for i in range(5)}
+
+    store.close()
+
+
+def test_sqlite_opens_in_wal_mode(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    sync = store._conn.execute("PRAGMA synchronous").fetchone()[0]
+    assert mode.lower() == "wal"
+    assert sync == 1  # NORMAL
+
+    store.put("A", {"v": 1})
+    store.close()
+
+    # data survives reopen
+    store = SQLiteWalletStorage(db_path)
+    assert store.get("A") == {"v": 1}
+    store.close()
+
+
+def test_sqlite_put_many_delete_many(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    store.put_many((f"DD_{i}", {"i": i}) for i in range(100))
+    store.put_many([("DD_0", "updated")])
+    assert store.get("DD_0") == "updated"
+    assert len(list(store.keys(prefix="DD_"))) == 100
+
+    store.delete_many(f"DD_{i}" for i in range(50))
+    store.delete_many(["missing"])
+    assert store.get("DD_49") is None
+    assert store.get("DD_50") == {"i": 50}
+    assert len(list(store.keys(prefix="DD_"))) == 50
+
+    store.close()
+
+
+def test_sqlite_values_roundtrip_exactly(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    values = {
+        "nested": {"b": [1, 2.5, None, True], "a": "é"},
+        "big": 2**70,
+        "int_keys": {1: "x"},
+    }
+    for k, v in values.items():
+        store.put(k, v)
+
+    assert store.get("nested") == values["nested"]
+    assert store.get("big") == 2**70
+    assert store.get("int_keys") == {"1": "x"}  # JSON object keys are strings
+
+    store.close()
+
+
+def test_sqlite_prefix_is_literal_and_case_sensitive(tmp_path: Path):
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    store.put_many([("DD_A", 1), ("DDXA", 2), ("dd_a", 3), ("DD%B", 4), ("DD_\U0010ffff", 5)])
+
+    # "_" and "%" are not wildcards; case matters (same as str.startswith)
+    assert list(store.keys(prefix="DD_")) == ["DD_A", "DD_\U0010ffff"]
+    assert list(store.keys(prefix="DD%")) == ["DD%B"]
+    assert dict(store.scan(prefix="dd_")) == {"dd_a": 3}
+    assert list(store.keys(prefix="\U0010ffff")) == []
+
+    store.close()
+
+
+def test_sqlite_keys_is_lazy_and_pages(tmp_path: Path, monkeypatch):
+    import core.storage.sqlite_store as sqlite_store
+
+    monkeypatch.setattr(sqlite_store, "_KEYS_PAGE_SIZE", 3)
+    db_path = tmp_path / "wallet.db"
+    store = SQLiteWalletStorage(db_path)
+
+    store.put_many((f"DD_{i:02d}", i) for i in range(10))
+    store.put("EQC_X", 1)
+
+    it = store.keys(prefix="DD_")
+    assert next(it) == "DD_00"
+
+    # the store stays usable mid-iteration (no lock/cursor held)
+    seen = ["DD_00"]
+    for k in it:
+        seen.append(k)
+        store.delete(k)
+    assert seen == [f"DD_{i:02d}" for i in range(10)]
+    assert list(store.keys()) == ["DD_00", "EQC_X"]
+
+    store.close()
+
+
+def test_sqlite_round_trips_non_finite_floats(tmp_path: Path):
+    import math
+
+    store = SQLiteWalletStorage(tmp_path / "wallet.db")
+    value = {"nan": float("nan"), "inf": [float("inf"), float("-inf")], "none": None}
+    store.put("K", value)
+
+    got = store.get("K")
+    assert math.isnan(got["nan"])
+    assert got["inf"] == [float("inf"), float("-inf")]
+    assert got["none"] is None
+
+    store.close()
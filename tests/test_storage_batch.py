@@ -69,3 +69,62 @@ def test_prefix_key_iteration():
 
     dd_keys = list(store.keys(prefix="DD_"))
     assert set(dd_keys) == {"DD_A", "DD_B"}
+
+
+def test_prefix_scan_returns_key_value_pairs():
+    store = MemoryWalletStorage()
+    store.put("DD_A", 1)
+    store.put("DD_B", {"n": 2})
+    store.put("EQC_X", 3)
+
+    pairs = dict(store.scan(prefix="DD_"))
+    assert pairs == {"DD_A": 1, "DD_B": {"n": 2}}
+
+
+def test_put_many_delete_many():
+    store = MemoryWalletStorage()
+
+    store.put_many([("a", 1), ("b", 2), ("c", 3)])
+    assert store.get("b") == 2
+
+    store.delete_many(["a", "c", "missing"])
+    assert set(store.keys()) == {"b"}
+
+
+def test_put_many_delete_many_publish_all_changes_at_once():
+    store = MemoryWalletStorage({"a": 0, "b": 0})
+
+    # Lock-free readers hold the published dict; bulk writes must swap in
+    # a new one rather than update it key by key.
+    before = store._data
+    store.put_many([("a", 1), ("b", 1)])
+    assert before == {"a": 0, "b": 0}
+    assert (store.get("a"), store.get("b")) == (1, 1)
+
+    before = store._data
+    store.delete_many(["a", "b"])
+    assert before == {"a": 1, "b": 1}
+    assert set(store.keys()) == set()
+
+
+def test_keys_is_a_snapshot_generator():
+    store = MemoryWalletStorage({"DD_a": 1, "DD_b": 2, "EQC_x": 3})
+
+    removed = []
+    for k in store.keys(prefix="DD_"):
+        store.delete(k)  # safe: keys() iterates a snapshot
+        removed.append(k)
+
+    assert sorted(removed) == ["DD_a", "DD_b"]
+    assert list(store.keys()) == ["EQC_x"]
+
+
+def test_keyns_normalizes_prefix_once():
+    ns = KeyNS(" dd ")
+    assert ns.k("BALANCE:addr") == "DD_BALANCE:addr"
+    assert ns == KeyNS(" dd ")
+    assert repr(ns) == "KeyNS(prefix=' dd ')"
+
+    blank = KeyNS("  ")  # construction is fine; use is not
+    with pytest.raises(ValueError):
+        blank.k("x")
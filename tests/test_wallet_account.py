@@ -37,3 +37,60 @@ def test_wallet_account_gap_limit_validation():
 
     with pytest.raises(ValueError):
         WalletAccount(root=root, gap_limit=0)
+
+
+def test_wallet_account_matches_full_path_and_follows_reassignment():
+    from core.wallet.keys.hd import bip44_path
+
+    seed = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+    root = HDNode.from_seed(seed)
+    acc = WalletAccount(root=root, coin_type=20, account=0)
+
+    for change, derive in ((0, acc.derive_receive_node), (1, acc.derive_change_node)):
+        for i in (0, 1, 7):
+            assert derive(i) == root.derive_path(bip44_path(20, 0, change, i))
+
+    acc.account = 1  # cache must not serve the old account's nodes
+    assert acc.derive_receive_node(0) == root.derive_path(bip44_path(20, 1, 0, 0))
+
+
+def test_wallet_account_iter_addresses_match_per_index():
+    seed = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+    root = HDNode.from_seed(seed)
+    acc = WalletAccount(root=root, coin_type=20, account=0)
+
+    assert list(acc.iter_receive_addresses(start=2, count=3)) == [acc.receive_address_at(i) for i in (2, 3, 4)]
+    assert list(acc.iter_change_addresses(count=2)) == [acc.change_address_at(i) for i in (0, 1)]
+    assert list(acc.iter_receive_addresses(count=0)) == []
+    with pytest.raises(ValueError):
+        list(acc.iter_receive_addresses(start=-1))
+
+
+def test_wallet_account_memoizes_addresses(monkeypatch):
+    import core.wallet.account as account_mod
+
+    seed = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+    root = HDNode.from_seed(seed)
+    acc = WalletAccount(root=root, coin_type=20, account=0)
+
+    calls = {"n": 0}
+    real = account_mod.address_from_node
+
+    def counting(node):
+        calls["n"] += 1
+        return real(node)
+
+    monkeypatch.setattr(account_mod, "address_from_node", counting)
+    monkeypatch.setattr(account_mod, "_ADDRESS_CACHE_MAX", 2)
+
+    a0 = acc.receive_address_at(0)
+    assert acc.receive_address_at(0) == a0
+    assert list(acc.iter_receive_addresses(count=1)) == [a0]
+    assert calls["n"] == 1
+
+    c0 = acc.change_address_at(0)
+    assert c0 != a0  # (change, index) keys do not collide
+    acc.receive_address_at(1)  # cap of 2: evicts the oldest (receive 0)
+    assert len(acc._address_cache) == 2
+    assert acc.receive_address_at(0) == a0
+    assert calls["n"] == 4
@@ -51,3 +51,11 @@ def test_scope_enforces_wallet_id():
     scope.assert_wallet("wallet-1")
     with pytest.raises(ValueError):
         scope.assert_wallet("wallet-2")
+
+
+def test_scope_hash_is_memoized_and_matches_fresh_hash():
+    scope = WSQKScope(wallet_id="w", action="send", context_hash="h", not_before=1, expires_at=2)
+    h = scope.scope_hash()
+    assert scope.scope_hash() is h
+    assert WSQKScope(wallet_id="w", action="send", context_hash="h", not_before=1, expires_at=2).scope_hash() == h
+    assert scope == WSQKScope(wallet_id="w", action="send", context_hash="h", not_before=1, expires_at=2)